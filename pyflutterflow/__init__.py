@@ -1,3 +1,4 @@
+import threading
 import importlib.resources as resources
 from pydantic_settings import BaseSettings
 from fastapi.staticfiles import StaticFiles
@@ -6,10 +7,13 @@ from fastapi.staticfiles import StaticFiles
 class PyFlutterflow:
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super(PyFlutterflow, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(PyFlutterflow, cls).__new__(cls)
         return cls._instance
 
     def __init__(self, settings: BaseSettings | None = None):
@@ -1,10 +1,17 @@
 import os
+import time
+import asyncio
+import hashlib
+from functools import lru_cache
+from itertools import islice
+from cachetools import TTLCache
 from pydantic import BaseModel
-from fastapi import HTTPException, Depends
+from fastapi import HTTPException, Depends, Query, Response
 from fastapi import status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from firebase_admin.auth import ExpiredIdTokenError
 from firebase_admin import auth
+from postgrest.exceptions import APIError
 from pyflutterflow import PyFlutterflow, constants
 from pyflutterflow.database.supabase.supabase_client import SupabaseClient
 from pyflutterflow.services.email.resend_service import ResendService
@@ -17,6 +24,28 @@ security = HTTPBearer()
 
 AVATAR_PLACEHOLDER_URL = os.getenv("AVATAR_PLACEHOLDER_URL", "")
 
+# Decoded firebase tokens, keyed by a sha256 hash of the raw token (never the token itself).
+# Entries are also checked against the token's own 'exp' claim, so a hit can never outlive the token.
+_token_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# Maximum number of rows sent to PostgREST in a single insert during the user sync.
+USER_SYNC_BATCH_SIZE = 500
+# Maximum number of concurrent single-row inserts when a batch is rejected.
+USER_SYNC_CONCURRENCY = 32
+# Page size used to read existing Supabase user ids. PostgREST returns at most 1000 rows by default.
+USER_SYNC_ID_PAGE_SIZE = 1000
+# Response header carrying the firebase page token for the next page of users.
+NEXT_PAGE_TOKEN_HEADER = "X-Next-Page-Token"
+
+
+@lru_cache(maxsize=1)
+def get_settings():
+    """
+    The settings are fixed once Pyflutterflow is initialized, so they are looked up
+    once and reused. A failed lookup is not cached, so this is safe to call before init.
+    """
+    return PyFlutterflow().get_settings()
+
 
 class FirestoreUser(BaseModel):
     """
@@ -54,10 +83,30 @@ class FirebaseAuthUser(BaseModel):
     email: str = constants.GUEST_EMAIL
     display_name: str | None = None
     photo_url: str | None = None
-    last_login_at: str
+    last_login_at: str | None = None
     created_at: str
     custom_attributes: str | None = None
 
+    @classmethod
+    def from_user_record(cls, user: auth.UserRecord) -> 'FirebaseAuthUser':
+        """
+        Build the model from a firebase auth UserRecord. The record comes straight
+        from the firebase admin SDK, so pydantic validation is skipped.
+        """
+        data = user._data
+        fields = {
+            'uid': data.get('localId'),
+            'email': data.get('email'),
+            'display_name': data.get('displayName'),
+            'photo_url': data.get('photoUrl'),
+            'last_login_at': data.get('lastLoginAt'),
+            'created_at': data.get('createdAt'),
+            'custom_attributes': data.get('customAttributes'),
+        }
+        # Only pass the keys firebase returned, so absent ones (e.g. the email of a phone
+        # or anonymous user) fall back to the model defaults rather than an explicit None.
+        return cls.model_construct(**{key: value for key, value in fields.items() if value is not None})
+
 
 class FirebaseUserClaims(BaseModel):
     """
@@ -68,47 +117,64 @@ class FirebaseUserClaims(BaseModel):
     role: str = 'admin'
 
 
-async def get_admin_user(token: HTTPAuthorizationCredentials = Depends(security)) -> FirebaseUser:
-    """Verify the JWT token, check for the admin service role, and then return the user object."""
-    current_user = await get_current_user(token)
-    if current_user.role == constants.ADMIN_ROLE:
-        return current_user
-    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="You are not an admin.")
-
-
-async def get_current_user(token: HTTPAuthorizationCredentials = Depends(security)) -> FirebaseUser:
-    """Verify the JWT token and return the user object."""
-    settings = PyFlutterflow().get_settings()
+async def get_verified_claims(token: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """
+    Verify the JWT token and return its decoded claims. Verified claims are cached
+    briefly, so repeat requests with the same token skip the signature check.
+    """
+    cache_key = hashlib.sha256(token.credentials.encode()).hexdigest()
+    cached_token = _token_cache.get(cache_key)
+    if cached_token and cached_token['exp'] > time.time():
+        return cached_token
     try:
-        decoded_token = auth.verify_id_token(token.credentials)
-        if settings.require_verified_email and not decoded_token.get("email_verified"):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not verified")
-        user = FirebaseUser(**decoded_token)
-        return user
+        decoded_token = await asyncio.to_thread(auth.verify_id_token, token.credentials)
     except ExpiredIdTokenError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Auth token has expired")
     except Exception as e:
         logger.error("Error encountered during JWT token verification: %s", e)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    if get_settings().require_verified_email and not decoded_token.get("email_verified"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not verified")
+    _token_cache[cache_key] = decoded_token
+    return decoded_token
 
 
-async def get_users_list(_: FirebaseUser = Depends(get_admin_user)) -> list[FirebaseAuthUser]:
-    """Get a list of all users in the firebase auth system."""
+async def get_admin_user(token: HTTPAuthorizationCredentials = Depends(security)) -> FirebaseUser:
+    """Verify the JWT token, check for the admin service role, and then return the user object."""
+    claims = await get_verified_claims(token)
+    if claims.get('role') != constants.ADMIN_ROLE:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="You are not an admin.")
+    return FirebaseUser.model_construct(**claims)
+
+
+async def get_current_user(token: HTTPAuthorizationCredentials = Depends(security)) -> FirebaseUser:
+    """
+    Verify the JWT token and return the user object. The claims have already been
+    verified by firebase, so the model is constructed without re-validation.
+    """
+    claims = await get_verified_claims(token)
+    return FirebaseUser.model_construct(**claims)
+
+
+async def get_users_list(
+    response: Response,
+    page_token: str | None = None,
+    page_size: int = Query(1000, ge=1, le=1000),
+    _: FirebaseUser = Depends(get_admin_user),
+) -> list[FirebaseAuthUser]:
+    """
+    Get a single page of users from the firebase auth system. If there are more users,
+    the token for the next page is returned in the X-Next-Page-Token response header.
+    """
     try:
-        users = auth.list_users(max_results=500)
-        users_list = []
-        for user in users.iterate_all():
-            data = user._data
-            users_list.append(FirebaseAuthUser(
-                uid=data.get('localId'),
-                email=data.get('email'),
-                display_name=data.get('displayName'),
-                photo_url=data.get('photoUrl'),
-                last_login_at=data.get('lastLoginAt'),
-                created_at=data.get('createdAt'),
-                custom_attributes=data.get('customAttributes'),
-            ))
+        page = await asyncio.to_thread(auth.list_users, page_token=page_token, max_results=page_size)
+        users_list = [FirebaseAuthUser.from_user_record(user) for user in page.users]
+        if page.next_page_token:
+            response.headers[NEXT_PAGE_TOKEN_HEADER] = page.next_page_token
         return users_list
+    except ValueError as e:
+        logger.warning("Invalid users list page token: %s", e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f'Invalid page token: {e}')
     except Exception as e:
         logger.error("Error encountered during getting users list: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Error encountered while getting users list.')
@@ -117,49 +183,86 @@ async def get_users_list(_: FirebaseUser = Depends(get_admin_user)) -> list[Fire
 async def get_firebase_user_by_uid(user_uid: str, _: FirebaseUser = Depends(get_admin_user)) -> FirebaseAuthUser:
     """Get a list of all users in the firebase auth system."""
     try:
-        user = auth.get_user(uid=user_uid)
-        data = user._data
-        return FirebaseAuthUser(
-            uid=data.get('localId'),
-            email=data.get('email'),
-            display_name=data.get('displayName'),
-            photo_url=data.get('photoUrl'),
-            last_login_at=data.get('lastLoginAt'),
-            created_at=data.get('createdAt'),
-            custom_attributes=data.get('customAttributes'),
-        )
+        user = await asyncio.to_thread(auth.get_user, user_uid)
+        return FirebaseAuthUser.from_user_record(user)
     except Exception as e:
         logger.error("Error encountered during getting users list: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Error encountered while getting users list.')
 
 
+async def insert_users_individually(sb_client, users_table: str, rows: list[dict]) -> None:
+    """
+    Insert user rows one at a time, concurrently, so that a single bad row
+    does not prevent the others from being added. Failures are logged per user.
+    """
+    semaphore = asyncio.Semaphore(USER_SYNC_CONCURRENCY)
+
+    async def insert_row(row: dict):
+        async with semaphore:
+            return await sb_client.table(users_table).insert(row).execute()
+
+    results = await asyncio.gather(*(insert_row(row) for row in rows), return_exceptions=True)
+    for row, result in zip(rows, results):
+        if isinstance(result, Exception):
+            logger.error("Unable to add user %s: %s", row['id'], result)
+
+
+async def get_supabase_user_ids(sb_client, users_table: str) -> set[str]:
+    """
+    Read every user id in the Supabase users table, one page at a time, until a short
+    page comes back. A single select would be capped at PostgREST's max rows.
+    """
+    user_ids = set()
+    start = 0
+    while True:
+        response = await (
+            sb_client.table(users_table)
+            .select('id')
+            .order('id')
+            .range(start, start + USER_SYNC_ID_PAGE_SIZE - 1)
+            .execute()
+        )
+        user_ids.update(user['id'] for user in response.data)
+        if len(response.data) < USER_SYNC_ID_PAGE_SIZE:
+            return user_ids
+        start += USER_SYNC_ID_PAGE_SIZE
+
+
 async def run_supabase_firestore_user_sync(_: FirebaseUser = Depends(get_admin_user)) -> None:
     """
-    Run a sync of Firebase users with Supabase users. Note this function
-    would need to be upgraded to handle large user lists (>1000 users).
+    Run a sync of Firebase users with Supabase users. Existing Supabase ids are
+    read in pages of USER_SYNC_ID_PAGE_SIZE, and missing users are inserted in
+    batches of USER_SYNC_BATCH_SIZE rows.
     """
     sb_client = await SupabaseClient().get_client()
-    settings = PyFlutterflow().get_settings()
+    settings = get_settings()
     users_table = settings.users_table or 'users'
     logger.info("Running user sync between Firebase and Supabase.")
-    response = await sb_client.table(users_table).select('id').execute()
-    supabase_users = [user['id'] for user in response.data]
+    supabase_users = await get_supabase_user_ids(sb_client, users_table)
     firestore_client = FirestoreClient().get_client()
     user_col = firestore_client.collection("users")
+    to_insert: list[dict] = []
     try:
         async for userdoc in user_col.stream():
             if userdoc.id not in supabase_users:
                 user = userdoc.to_dict()
                 logger.info("Adding user: %s", userdoc.id)
                 if user.get('display_name') and user.get('email'):
-                    await sb_client.table(users_table).insert({
+                    to_insert.append({
                         'id': userdoc.id,
                         'email': user.get('email'),
                         'display_name': user.get('display_name'),
                         'photo_url': user.get('photo_url') or settings.avatar_placeholder_url or ''
-                    }).execute()
+                    })
                 else:
                     logger.error("User %s does not have a display name or email.", userdoc.id)
+        rows = iter(to_insert)
+        while batch := list(islice(rows, USER_SYNC_BATCH_SIZE)):
+            try:
+                await sb_client.table(users_table).insert(batch).execute()
+            except APIError as e:
+                logger.warning("Batch insert of %s users failed, inserting individually: %s", len(batch), e)
+                await insert_users_individually(sb_client, users_table, batch)
     except Exception as e:
         trigger_slack_webhook(f"Error encountered during user sync: {e}")
         logger.error("Error encountered during getting users list: %s", e)
@@ -168,7 +271,7 @@ async def run_supabase_firestore_user_sync(_: FirebaseUser = Depends(get_admin_u
 
 async def onboard_new_user(current_user: FirebaseUser = Depends(get_current_user)):
     """Create a new user record in Supabase and send a welcome email to the user."""
-    settings = PyFlutterflow().get_settings()
+    settings = get_settings()
     users_table = settings.users_table or 'users'
     sb_client = await SupabaseClient().get_client()
     firestore_client = FirestoreClient().get_client()
@@ -187,7 +290,9 @@ async def onboard_new_user(current_user: FirebaseUser = Depends(get_current_user
                 detail='Error encountered while creating user record in supabase: Incorrect Postgrest response.'
             )
         if current_user.email != constants.GUEST_EMAIL:
-            verification_link = auth.generate_email_verification_link(current_user.email) if not current_user.email_verified else None
+            verification_link = None
+            if not current_user.email_verified:
+                verification_link = await asyncio.to_thread(auth.generate_email_verification_link, current_user.email)
             await ResendService().send_welcome_email(current_user, verification_link)
         logger.info("User record created in supabase for user: %s", current_user.uid)
     except Exception as e:
@@ -210,7 +315,7 @@ async def set_user_role(user_claim: FirebaseUserClaims, user: FirebaseUser = Dep
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User does not have permission to set user role.")
     try:
         logger.info("Setting user role: %s for user: %s", user_claim.role, user_claim.uid)
-        auth.set_custom_user_claims(user_claim.uid, {'role': user_claim.role})
+        await asyncio.to_thread(auth.set_custom_user_claims, user_claim.uid, {'role': user_claim.role})
     except Exception as e:
         logger.error("Error encountered during setting user role: %s", e)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Error encountered while setting user role.')
@@ -219,7 +324,7 @@ async def set_user_role(user_claim: FirebaseUserClaims, user: FirebaseUser = Dep
 
 
 async def generate_firebase_verify_link(email: str) -> str:
-    return auth.generate_email_verification_link(email)
+    return await asyncio.to_thread(auth.generate_email_verification_link, email)
 
 
 async def delete_user(user_uid: str, user: FirebaseUser = Depends(get_admin_user)):
@@ -229,7 +334,7 @@ async def delete_user(user_uid: str, user: FirebaseUser = Depends(get_admin_user
 
     # From Firebase Auth
     try:
-        auth.delete_user(user_uid)
+        await asyncio.to_thread(auth.delete_user, user_uid)
         logger.info("Deleted user: %s", user_uid)
     except Exception as e:
         logger.error("Error encountered during deleting user: %s", e)
@@ -247,7 +352,7 @@ async def delete_user(user_uid: str, user: FirebaseUser = Depends(get_admin_user
     # From Supabase
     try:
         client = await SupabaseClient().get_client()
-        settings = PyFlutterflow().get_settings()
+        settings = get_settings()
         users_table = settings.users_table or 'users'
         await client.table(users_table).delete().eq('id', user_uid).execute()
         logger.info("Deleted Supabase data for user %s", user_uid)
@@ -4745,7 +4745,7 @@ In order to be iterable, non-array objects must have a [Symbol.iterator]() metho
 }
 `)},qT={root:function(e){var n=e.props;return["p-fileupload p-fileupload-".concat(n.mode," p-component")]},header:"p-fileupload-header",pcChooseButton:"p-fileupload-choose-button",pcUploadButton:"p-fileupload-upload-button",pcCancelButton:"p-fileupload-cancel-button",content:"p-fileupload-content",fileList:"p-fileupload-file-list",file:"p-fileupload-file",fileThumbnail:"p-fileupload-file-thumbnail",fileInfo:"p-fileupload-file-info",fileName:"p-fileupload-file-name",fileSize:"p-fileupload-file-size",pcFileBadge:"p-fileupload-file-badge",fileActions:"p-fileupload-file-actions",pcFileRemoveButton:"p-fileupload-file-remove-button"},KT=Pe.extend({name:"fileupload",theme:HT,classes:qT}),WT={name:"BaseFileUpload",extends:ct,props:{name:{type:String,default:null},url:{type:String,default:null},mode:{type:String,default:"advanced"},multiple:{type:Boolean,default:!1},accept:{type:String,default:null},disabled:{type:Boolean,default:!1},auto:{type:Boolean,default:!1},maxFileSize:{type:Number,default:null},invalidFileSizeMessage:{type:String,default:"{0}: Invalid file size, file size should be smaller than {1}."},invalidFileTypeMessage:{type:String,default:"{0}: Invalid file type, allowed file types: {1}."},fileLimit:{type:Number,default:null},invalidFileLimitMessage:{type:String,default:"Maximum number of files exceeded, limit is {0} at most."},withCredentials:{type:Boolean,default:!1},previewWidth:{type:Number,default:50},chooseLabel:{type:String,default:null},uploadLabel:{type:String,default:null},cancelLabel:{type:String,default:null},customUpload:{type:Boolean,default:!1},showUploadButton:{type:Boolean,default:!0},showCancelButton:{type:Boolean,default:!0},chooseIcon:{type:String,default:void 0},uploadIcon:{type:String,default:void 0},cancelIcon:{type:String,default:void 0},style:null,class:null,chooseButtonProps:{type:null,default:null},uploadButtonProps:{type:Object,default:function(){return{severity:"secondary"}}},cancelButtonProps:{type:Object,default:function(){return{severity:"secondary"}}}},style:KT,provide:function(){return{$pcFileUpload:this,$parentInstance:this}}},C0={name:"FileContent",hostName:"FileUpload",extends:ct,emits:["remove"],props:{files:{type:Array,default:function(){return[]}},badgeSeverity:{type:String,default:"warn"},badgeValue:{type:String,default:null},previewWidth:{type:Number,default:50},templates:{type:null,default:null}},methods:{formatSize:function(e){var n,r=1024,o=3,i=((n=this.$primevue.config.locale)===null||n===void 0?void 0:n.fileSizeTypes)||["B","KB","MB","GB","TB","PB","EB","ZB","YB"];if(e===0)return"0 ".concat(i[0]);var a=Math.floor(Math.log(e)/Math.log(r)),l=parseFloat((e/Math.pow(r,a)).toFixed(o));return"".concat(l," ").concat(i[a])}},components:{Button:We,Badge:ii,TimesIcon:Zr}},YT=["alt","src","width"];function GT(t,e,n,r,o,i){var a=De("Badge"),l=De("TimesIcon"),s=De("Button");return R(!0),q(_e,null,ft(n.files,function(u,c){return R(),q("div",$({key:u.name+u.type+u.size,class:t.cx("file"),ref_for:!0},t.ptm("file")),[H("img",$({role:"presentation",class:t.cx("fileThumbnail"),alt:u.name,src:u.objectURL,width:n.previewWidth,ref_for:!0},t.ptm("fileThumbnail")),null,16,YT),H("div",$({class:t.cx("fileInfo"),ref_for:!0},t.ptm("fileInfo")),[H("div",$({class:t.cx("fileName"),ref_for:!0},t.ptm("fileName")),ye(u.name),17),H("span",$({class:t.cx("fileSize"),ref_for:!0},t.ptm("fileSize")),ye(i.formatSize(u.size)),17)],16),ue(a,{value:n.badgeValue,class:je(t.cx("pcFileBadge")),severity:n.badgeSeverity,unstyled:t.unstyled,pt:t.ptm("pcFileBadge")},null,8,["value","class","severity","unstyled","pt"]),H("div",$({class:t.cx("fileActions"),ref_for:!0},t.ptm("fileActions")),[ue(s,{onClick:function(f){return t.$emit("remove",c)},text:"",rounded:"",severity:"danger",class:je(t.cx("pcFileRemoveButton")),unstyled:t.unstyled,pt:t.ptm("pcFileRemoveButton")},{icon:Se(function(d){return[n.templates.fileremoveicon?(R(),ke($e(n.templates.fileremoveicon),{key:0,class:je(d.class),file:u,index:c},null,8,["class","file","index"])):(R(),ke(l,$({key:1,class:d.class,"aria-hidden":"true",ref_for:!0},t.ptm("pcFileRemoveButton").icon),null,16,["class"]))]}),_:2},1032,["onClick","class","unstyled","pt"])],16)],16)}),128)}C0.render=GT;function fu(t){return JT(t)||XT(t)||_0(t)||ZT()}function ZT(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
 In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function XT(t){if(typeof Symbol<"u"&&t[Symbol.iterator]!=null||t["@@iterator"]!=null)return Array.from(t)}function JT(t){if(Array.isArray(t))return ld(t)}function Cs(t,e){var n=typeof Symbol<"u"&&t[Symbol.iterator]||t["@@iterator"];if(!n){if(Array.isArray(t)||(n=_0(t))||e){n&&(t=n);var r=0,o=function(){};return{s:o,n:function(){return r>=t.length?{done:!0}:{done:!1,value:t[r++]}},e:function(u){throw u},f:o}}throw new TypeError(`Invalid attempt to iterate non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var i,a=!0,l=!1;return{s:function(){n=n.call(t)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,i=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw i}}}}function _0(t,e){if(t){if(typeof t=="string")return ld(t,e);var n={}.toString.call(t).slice(8,-1);return n==="Object"&&t.constructor&&(n=t.constructor.name),n==="Map"||n==="Set"?Array.from(t):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ld(t,e):void 0}}function ld(t,e){(e==null||e>t.length)&&(e=t.length);for(var n=0,r=Array(e);n<e;n++)r[n]=t[n];return r}var I0={name:"FileUpload",extends:WT,inheritAttrs:!1,emits:["select","uploader","before-upload","progress","upload","error","before-send","clear","remove","remove-uploaded-file"],duplicateIEEvent:!1,data:function(){return{uploadedFileCount:0,files:[],messages:[],focused:!1,progress:null,uploadedFiles:[]}},methods:{upload:function(){this.hasFiles&&this.uploader()},onBasicUploaderClick:function(e){e.button===0&&this.$refs.fileInput.click()},onFileSelect:function(e){if(e.type!=="drop"&&this.isIE11()&&this.duplicateIEEvent){this.duplicateIEEvent=!1;return}this.isBasic&&this.hasFiles&&(this.files=[]),this.messages=[],this.files=this.files||[];var n=e.dataTransfer?e.dataTransfer.files:e.target.files,r=Cs(n),o;try{for(r.s();!(o=r.n()).done;){var i=o.value;this.isFileSelected(i)||this.validate(i)&&(this.isImage(i)&&(i.objectURL=window.URL.createObjectURL(i)),this.files.push(i))}}catch(a){r.e(a)}finally{r.f()}this.$emit("select",{originalEvent:e,files:this.files}),this.fileLimit&&this.checkFileLimit(),this.auto&&this.hasFiles&&!this.isFileLimitExceeded()&&this.uploader(),e.type!=="drop"&&this.isIE11()?this.clearIEInput():this.clearInputElement()},choose:function(){this.$refs.fileInput.click()},uploader:function(){var e=this;if(this.customUpload)this.fileLimit&&(this.uploadedFileCount+=this.files.length),this.$emit("uploader",{files:this.files}),this.clear();else{var n=new XMLHttpRequest,r=new FormData;this.$emit("before-upload",{xhr:n,formData:r});var o=Cs(this.files),i;try{for(o.s();!(i=o.n()).done;){var a=i.value;r.append(this.name,a,a.name)}}catch(l){o.e(l)}finally{o.f()}n.upload.addEventListener("progress",function(l){l.lengthComputable&&(e.progress=Math.round(l.loaded*100/l.total)),e.$emit("progress",{originalEvent:l,progress:e.progress})}),n.onreadystatechange=function(){if(n.readyState===4){var l;e.progress=0,n.status>=200&&n.status<300?(e.fileLimit&&(e.uploadedFileCount+=e.files.length),e.$emit("upload",{xhr:n,files:e.files})):e.$emit("error",{xhr:n,files:e.files}),(l=e.uploadedFiles).push.apply(l,fu(e.files)),e.clear()}},n.open("POST",this.url,!0),this.$emit("before-send",{xhr:n,formData:r}),n.withCredentials=this.withCredentials,n.send(r)}},clear:function(){this.files=[],this.messages=null,this.$emit("clear"),this.isAdvanced&&this.clearInputElement()},onFocus:function(){this.focused=!0},onBlur:function(){this.focused=!1},isFileSelected:function(e){if(this.files&&this.files.length){var n=Cs(this.files),r;try{for(n.s();!(r=n.n()).done;){var o=r.value;if(o.name+o.type+o.size===e.name+e.type+e.size)return!0}}catch(i){n.e(i)}finally{n.f()}}return!1},isIE11:function(){return!!window.MSInputMethodContext&&!!document.documentMode},validate:function(e){return this.accept&&!this.isFileTypeValid(e)?(this.messages.push(this.invalidFileTypeMessage.replace("{0}",e.name).replace("{1}",this.accept)),!1):this.maxFileSize&&e.size>this.maxFileSize?(this.messages.push(this.invalidFileSizeMessage.replace("{0}",e.name).replace("{1}",this.formatSize(this.maxFileSize))),!1):!0},isFileTypeValid:function(e){var n=this.accept.split(",").map(function(l){return l.trim()}),r=Cs(n),o;try{for(r.s();!(o=r.n()).done;){var i=o.value,a=this.isWildcard(i)?this.getTypeClass(e.type)===this.getTypeClass(i):e.type==i||this.getFileExtension(e).toLowerCase()===i.toLowerCase();if(a)return!0}}catch(l){r.e(l)}finally{r.f()}return!1},getTypeClass:function(e){return e.substring(0,e.indexOf("/"))},isWildcard:function(e){return e.indexOf("*")!==-1},getFileExtension:function(e){return"."+e.name.split(".").pop()},isImage:function(e){return/^image\//.test(e.type)},onDragEnter:function(e){this.disabled||(e.stopPropagation(),e.preventDefault())},onDragOver:function(e){this.disabled||(!this.isUnstyled&&si(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!0),e.stopPropagation(),e.preventDefault())},onDragLeave:function(){this.disabled||(!this.isUnstyled&&bo(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!1))},onDrop:function(e){if(!this.disabled){!this.isUnstyled&&bo(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!1),e.stopPropagation(),e.preventDefault();var n=e.dataTransfer?e.dataTransfer.files:e.target.files,r=this.multiple||n&&n.length===1;r&&this.onFileSelect(e)}},remove:function(e){this.clearInputElement();var n=this.files.splice(e,1)[0];this.files=fu(this.files),this.$emit("remove",{file:n,files:this.files})},removeUploadedFile:function(e){var n=this.uploadedFiles.splice(e,1)[0];this.uploadedFiles=fu(this.uploadedFiles),this.$emit("remove-uploaded-file",{file:n,files:this.uploadedFiles})},clearInputElement:function(){this.$refs.fileInput.value=""},clearIEInput:function(){this.$refs.fileInput&&(this.duplicateIEEvent=!0,this.$refs.fileInput.value="")},formatSize:function(e){var n,r=1024,o=3,i=((n=this.$primevue.config.locale)===null||n===void 0?void 0:n.fileSizeTypes)||["B","KB","MB","GB","TB","PB","EB","ZB","YB"];if(e===0)return"0 ".concat(i[0]);var a=Math.floor(Math.log(e)/Math.log(r)),l=parseFloat((e/Math.pow(r,a)).toFixed(o));return"".concat(l," ").concat(i[a])},isFileLimitExceeded:function(){return this.fileLimit&&this.fileLimit<=this.files.length+this.uploadedFileCount&&this.focused&&(this.focused=!1),this.fileLimit&&this.fileLimit<this.files.length+this.uploadedFileCount},checkFileLimit:function(){this.isFileLimitExceeded()&&this.messages.push(this.invalidFileLimitMessage.replace("{0}",this.fileLimit.toString()))},onMessageClose:function(){this.messages=null}},computed:{isAdvanced:function(){return this.mode==="advanced"},isBasic:function(){return this.mode==="basic"},chooseButtonClass:function(){return[this.cx("pcChooseButton"),this.class]},basicFileChosenLabel:function(){var e;if(this.auto)return this.chooseButtonLabel;if(this.hasFiles){var n;return this.files&&this.files.length===1?this.files[0].name:(n=this.$primevue.config.locale)===null||n===void 0||(n=n.fileChosenMessage)===null||n===void 0?void 0:n.replace("{0}",this.files.length)}return((e=this.$primevue.config.locale)===null||e===void 0?void 0:e.noFileChosenMessage)||""},hasFiles:function(){return this.files&&this.files.length>0},hasUploadedFiles:function(){return this.uploadedFiles&&this.uploadedFiles.length>0},chooseDisabled:function(){return this.disabled||this.fileLimit&&this.fileLimit<=this.files.length+this.uploadedFileCount},uploadDisabled:function(){return this.disabled||!this.hasFiles||this.fileLimit&&this.fileLimit<this.files.length},cancelDisabled:function(){return this.disabled||!this.hasFiles},chooseButtonLabel:function(){return this.chooseLabel||this.$primevue.config.locale.choose},uploadButtonLabel:function(){return this.uploadLabel||this.$primevue.config.locale.upload},cancelButtonLabel:function(){return this.cancelLabel||this.$primevue.config.locale.cancel},completedLabel:function(){return this.$primevue.config.locale.completed},pendingLabel:function(){return this.$primevue.config.locale.pending}},components:{Button:We,ProgressBar:S0,Message:x0,FileContent:C0,PlusIcon:w0,UploadIcon:k0,TimesIcon:Zr},directives:{ripple:Hn}},QT=["multiple","accept","disabled"],e7=["files"],t7=["accept","disabled","multiple"];function n7(t,e,n,r,o,i){var a=De("Button"),l=De("ProgressBar"),s=De("Message"),u=De("FileContent");return i.isAdvanced?(R(),q("div",$({key:0,class:t.cx("root")},t.ptmi("root")),[H("input",$({ref:"fileInput",type:"file",onChange:e[0]||(e[0]=function(){return i.onFileSelect&&i.onFileSelect.apply(i,arguments)}),multiple:t.multiple,accept:t.accept,disabled:i.chooseDisabled},t.ptm("input")),null,16,QT),H("div",$({class:t.cx("header")},t.ptm("header")),[ve(t.$slots,"header",{files:o.files,uploadedFiles:o.uploadedFiles,chooseCallback:i.choose,uploadCallback:i.uploader,clearCallback:i.clear},function(){return[ue(a,$({label:i.chooseButtonLabel,class:i.chooseButtonClass,style:t.style,disabled:t.disabled,unstyled:t.unstyled,onClick:i.choose,onKeydown:ot(i.choose,["enter"]),onFocus:i.onFocus,onBlur:i.onBlur},t.chooseButtonProps,{pt:t.ptm("pcChooseButton")}),{icon:Se(function(c){return[ve(t.$slots,"chooseicon",{},function(){return[(R(),ke($e(t.chooseIcon?"span":"PlusIcon"),$({class:[c.class,t.chooseIcon],"aria-hidden":"true"},t.ptm("pcChooseButton").icon),null,16,["class"]))]})]}),_:3},16,["label","class","style","disabled","unstyled","onClick","onKeydown","onFocus","onBlur","pt"]),t.showUploadButton?(R(),ke(a,$({key:0,class:t.cx("pcUploadButton"),label:i.uploadButtonLabel,onClick:i.uploader,disabled:i.uploadDisabled,unstyled:t.unstyled},t.uploadButtonProps,{pt:t.ptm("pcUploadButton")}),{icon:Se(function(c){return[ve(t.$slots,"uploadicon",{},function(){return[(R(),ke($e(t.uploadIcon?"span":"UploadIcon"),$({class:[c.class,t.uploadIcon],"aria-hidden":"true"},t.ptm("pcUploadButton").icon,{"data-pc-section":"uploadbuttonicon"}),null,16,["class"]))]})]}),_:3},16,["class","label","onClick","disabled","unstyled","pt"])):he("",!0),t.showCancelButton?(R(),ke(a,$({key:1,class:t.cx("pcCancelButton"),label:i.cancelButtonLabel,onClick:i.clear,disabled:i.cancelDisabled,unstyled:t.unstyled},t.cancelButtonProps,{pt:t.ptm("pcCancelButton")}),{icon:Se(function(c){return[ve(t.$slots,"cancelicon",{},function(){return[(R(),ke($e(t.cancelIcon?"span":"TimesIcon"),$({class:[c.class,t.cancelIcon],"aria-hidden":"true"},t.ptm("pcCancelButton").icon,{"data-pc-section":"cancelbuttonicon"}),null,16,["class"]))]})]}),_:3},16,["class","label","onClick","disabled","unstyled","pt"])):he("",!0)]})],16),H("div",$({ref:"content",class:t.cx("content"),onDragenter:e[1]||(e[1]=function(){return i.onDragEnter&&i.onDragEnter.apply(i,arguments)}),onDragover:e[2]||(e[2]=function(){return i.onDragOver&&i.onDragOver.apply(i,arguments)}),onDragleave:e[3]||(e[3]=function(){return i.onDragLeave&&i.onDragLeave.apply(i,arguments)}),onDrop:e[4]||(e[4]=function(){return i.onDrop&&i.onDrop.apply(i,arguments)})},t.ptm("content"),{"data-p-highlight":!1}),[ve(t.$slots,"content",{files:o.files,uploadedFiles:o.uploadedFiles,removeUploadedFileCallback:i.removeUploadedFile,removeFileCallback:i.remove,progress:o.progress,messages:o.messages},function(){return[i.hasFiles?(R(),ke(l,{key:0,value:o.progress,showValue:!1,unstyled:t.unstyled,pt:t.ptm("pcProgressbar")},null,8,["value","unstyled","pt"])):he("",!0),(R(!0),q(_e,null,ft(o.messages,function(c){return R(),ke(s,{key:c,severity:"error",onClose:i.onMessageClose,unstyled:t.unstyled,pt:t.ptm("pcMessage")},{default:Se(function(){return[gt(ye(c),1)]}),_:2},1032,["onClose","unstyled","pt"])}),128)),i.hasFiles?(R(),q("div",{key:1,class:je(t.cx("fileList"))},[ue(u,{files:o.files,onRemove:i.remove,badgeValue:i.pendingLabel,previewWidth:t.previewWidth,templates:t.$slots,unstyled:t.unstyled,pt:t.pt},null,8,["files","onRemove","badgeValue","previewWidth","templates","unstyled","pt"])],2)):he("",!0),i.hasUploadedFiles?(R(),q("div",{key:2,class:je(t.cx("fileList"))},[ue(u,{files:o.uploadedFiles,onRemove:i.removeUploadedFile,badgeValue:i.completedLabel,badgeSeverity:"success",previewWidth:t.previewWidth,templates:t.$slots,unstyled:t.unstyled,pt:t.pt},null,8,["files","onRemove","badgeValue","previewWidth","templates","unstyled","pt"])],2)):he("",!0)]}),t.$slots.empty&&!i.hasFiles&&!i.hasUploadedFiles?(R(),q("div",Ba($({key:0},t.ptm("empty"))),[ve(t.$slots,"empty")],16)):he("",!0)],16)],16)):i.isBasic?(R(),q("div",$({key:1,class:t.cx("root")},t.ptmi("root")),[(R(!0),q(_e,null,ft(o.messages,function(c){return R(),ke(s,{key:c,severity:"error",onClose:i.onMessageClose,unstyled:t.unstyled,pt:t.ptm("pcMessage")},{default:Se(function(){return[gt(ye(c),1)]}),_:2},1032,["onClose","unstyled","pt"])}),128)),ue(a,$({label:i.chooseButtonLabel,class:i.chooseButtonClass,style:t.style,disabled:t.disabled,unstyled:t.unstyled,onMouseup:i.onBasicUploaderClick,onKeydown:ot(i.choose,["enter"]),onFocus:i.onFocus,onBlur:i.onBlur},t.chooseButtonProps,{pt:t.ptm("pcChooseButton")}),{icon:Se(function(c){return[ve(t.$slots,"chooseicon",{},function(){return[(R(),ke($e(t.chooseIcon?"span":"PlusIcon"),$({class:[c.class,t.chooseIcon],"aria-hidden":"true"},t.ptm("pcChooseButton").icon),null,16,["class"]))]})]}),_:3},16,["label","class","style","disabled","unstyled","onMouseup","onKeydown","onFocus","onBlur","pt"]),t.auto?he("",!0):ve(t.$slots,"filelabel",{key:0,class:je(t.cx("filelabel"))},function(){return[H("span",{class:je(t.cx("filelabel")),files:o.files},ye(i.basicFileChosenLabel),11,e7)]}),H("input",$({ref:"fileInput",type:"file",accept:t.accept,disabled:t.disabled,multiple:t.multiple,onChange:e[5]||(e[5]=function(){return i.onFileSelect&&i.onFileSelect.apply(i,arguments)}),onFocus:e[6]||(e[6]=function(){return i.onFocus&&i.onFocus.apply(i,arguments)}),onBlur:e[7]||(e[7]=function(){return i.onBlur&&i.onBlur.apply(i,arguments)})},t.ptm("input")),null,16,t7)],16)):he("",!0)}I0.render=n7;const r7={class:"card"},o7={class:"flex flex-wrap justify-between items-center flex-1 gap-4"},i7={class:"flex gap-2"},a7={class:"flex flex-col gap-8 pt-4"},s7={key:0},l7={class:"flex flex-wrap gap-4"},c7=["alt","src"],u7={class:"font-semibold text-ellipsis max-w-60 whitespace-nowrap overflow-hidden"},d7={key:1},f7={class:"flex flex-wrap gap-4"},p7=["alt","src"],h7={class:"font-semibold text-ellipsis max-w-60 whitespace-nowrap overflow-hidden"},m7={__name:"ImageUploader",emits:["upload-complete"],setup(t,{emit:e}){const n=e,r=Bk(),o=Kn(),i=tt(0),a=tt(0),l=tt([]),s=(f,p,h)=>{p(h),i.value-=parseInt(d(f.size)),a.value=i.value/10},u=f=>{l.value=f.files,l.value.forEach(p=>{i.value+=parseInt(d(p.size))})},c=async f=>{try{const p=new FormData;l.value.forEach(m=>{p.append("image",m)});const h=await kt.post("/cloudinary-upload",p,{headers:{"Content-Type":"multipart/form-data"}});h.data&&(o.add({severity:"success",summary:"Success",detail:"Files uploaded successfully",life:3e3}),n("upload-complete",h.data))}catch(p){o.add({severity:"error",summary:"Error",detail:p.message||"Failed to upload files",life:3e3})}};function d(f){const m=r.config.locale.fileSizeTypes;if(f===0)return`0 ${m[0]}`;const v=Math.floor(Math.log(f)/Math.log(1024));return`${parseFloat((f/Math.pow(1024,v)).toFixed(3))} ${m[v]}`}return(f,p)=>(R(),q("div",r7,[ue(we(I0),{name:"image",multiple:!1,accept:"image/*",maxFileSize:1e6,onSelect:u,onUpload:p[0]||(p[0]=h=>c())},{header:Se(({chooseCallback:h,uploadCallback:m,clearCallback:v,files:y})=>[H("div",o7,[H("div",i7,[ue(we(We),{onClick:b=>h(),icon:"fa fa-images",rounded:"",outlined:"",severity:"info"},null,8,["onClick"]),ue(we(We),{onClick:b=>c(m),icon:"fa fa-cloud-upload",rounded:"",outlined:"",severity:"success",disabled:!y||y.length===0},null,8,["onClick","disabled"]),ue(we(We),{onClick:b=>v(),icon:"fa fa-times",rounded:"",outlined:"",severity:"danger",disabled:!y||y.length===0},null,8,["onClick","disabled"])])])]),content:Se(({files:h,uploadedFiles:m,removeUploadedFileCallback:v,removeFileCallback:y})=>[H("div",a7,[h.length>0?(R(),q("div",s7,[p[1]||(p[1]=H("h5",null,"Pending",-1)),H("div",l7,[(R(!0),q(_e,null,ft(h,(b,w)=>(R(),q("div",{key:b.name+b.type+b.size,class:"p-8 rounded-border flex flex-col border border-surface items-center gap-4"},[H("div",null,[H("img",{role:"presentation",alt:b.name,src:b.objectURL,width:"100",height:"50"},null,8,c7)]),H("span",u7,ye(b.name),1),H("div",null,ye(d(b.size)),1),ue(we(ii),{value:"Pending",severity:"warn"}),ue(we(We),{icon:"fa fa-times",onClick:g=>s(b,y,w),outlined:"",rounded:"",severity:"danger"},null,8,["onClick"])]))),128))])])):he("",!0),m.length>0?(R(),q("div",d7,[p[2]||(p[2]=H("h5",null,"Completed",-1)),H("div",f7,[(R(!0),q(_e,null,ft(m,(b,w)=>(R(),q("div",{key:b.name+b.type+b.size,class:"p-8 rounded-border flex flex-col border border-surface items-center gap-4"},[H("div",null,[H("img",{role:"presentation",alt:b.name,src:b.objectURL,width:"100",height:"50"},null,8,p7)]),H("span",h7,ye(b.name),1),H("div",null,ye(d(b.size)),1),ue(we(ii),{value:"Completed",class:"mt-4",severity:"success"}),ue(we(We),{icon:"fa fa-times",onClick:g=>v(w),outlined:"",rounded:"",severity:"danger"},null,8,["onClick"])]))),128))])])):he("",!0)])]),empty:Se(()=>p[3]||(p[3]=[H("div",{class:"flex items-center justify-center flex-col"},[H("i",{class:"fa fa-cloud-upload !border-2 !rounded-full !p-4 !text-xl"}),H("p",{class:"mt-6 mb-0 text-surface-600"},"Drag and drop files to here to upload.")],-1)])),_:1})]))}},g7={class:"my-6 w-full flex justify-between"},b7={class:"text-xl"},v7={class:"text-xl"},y7={class:"text-xs text-surface-500"},w7={class:"flex flex-col gap-4 w-full max-w-xl"},k7={class:"my-6"},x7={key:0},S7={key:0,class:"flex flex-col"},C7={class:"text-surface-600"},_7={key:1,class:"flex flex-col"},I7={class:"text-surface-600"},E7={key:2,class:"flex flex-col"},O7={class:"text-surface-600"},T7={key:3,class:"flex flex-col"},A7={class:"text-surface-600"},P7={key:4,class:"flex flex-col"},L7={class:"text-surface-600"},D7={key:5,class:"flex flex-col"},R7={class:"text-surface-600"},B7={class:"md:flex justify-between"},M7=["src"],N7={key:6,class:"flex flex-col"},$7={class:"text-surface-600"},F7={key:0,class:"text-xs text-surface-600"},j7={class:"flex flex-col items-center justify-center shadow rounded-lg p-2"},z7=["src"],V7={class:"text-[0.6rem] text-surface-400"},U7={__name:"DatabaseEntityDetail",setup(t){const e=dt(),n=Kn(),r=tt({}),o=za(),i=ja(),a=o0(),l=tt({}),s=Hd();Un(async()=>{await u()});const u=async()=>{l.value=e.dashboardConfig.models.find(p=>p.collection_name===o.params.entity),r.value=await a.getDatabaseEntityDetail(o.params.entity,o.params.id)},c=(p,h)=>{r.value[h]=p},d=async()=>{const p=await a.upsertDatabaseEntity(o.params.entity,o.params.id,r.value);o.params.id==="create"&&i.push(`/${o.params.entity}`),n.add(p)},f=async()=>{s.require({header:"Confirm Delete",message:"Are you sure you want to delete this database entry?",icon:"fa-solid fa-exclamation-circle",rejectLabel:"Cancel",confirmLabel:"Confirm",accept:async()=>{const p=await a.deleteDatabaseEntity(o.params.entity,o.params.id);n.add(p),i.push(`/${o.params.entity}`)}})};return(p,h)=>(R(),q(_e,null,[H("div",g7,[H("div",b7,[H("h1",v7,ye(l.value.display_name)+" document ",1),H("span",y7,"Database ID => "+ye(we(o).params.id),1)]),l.value.read_only?he("",!0):(R(),ke(we(We),{key:0,onClick:f,icon:"fa-solid fa-trash text-red-600",text:""}))]),H("div",w7,[(R(!0),q(_e,null,ft(l.value.fields,m=>(R(),q("div",k7,[m&&r.value?(R(),q("div",x7,[m.type==="String"?(R(),q("div",S7,[H("label",C7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(Io),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Date"?(R(),q("div",_7,[H("label",I7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(y0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,dateFormat:"yy-mm-dd"},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Boolean"?(R(),q("div",E7,[H("label",O7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(p0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,binary:""},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Integer"?(R(),q("div",T7,[H("label",A7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(d0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,inputId:"integeronly",fluid:""},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Raw"?(R(),q("div",P7,[H("label",L7,ye(m.fieldName.replace(/_/g," ")),1),gt(" "+ye(r.value[m.fieldName]),1)])):m.type==="Image"?(R(),q("div",D7,[H("label",R7,ye(m.fieldName.replace(/_/g," ")),1),H("div",B7,[r.value[m.fieldName]?(R(),q("img",{key:0,class:"w-40 h-40 rounded-full",src:r.value[m.fieldName].public_url,alt:""},null,8,M7)):he("",!0),ue(m7,{onUploadComplete:v=>c(v,m.fieldName)},null,8,["onUploadComplete"])])])):m.type==="FirebaseUserList"?(R(),q("div",N7,[H("label",$7,ye(m.fieldName.replace(/_/g," ")),1),r.value[m.fieldName]&&r.value[m.fieldName].length==0?(R(),q("div",F7,"None")):he("",!0),(R(!0),q(_e,null,ft(r.value[m.fieldName],v=>(R(),q("div",{key:v.id,class:"grid grid-cols-2 md:grid-cols-3"},[H("div",j7,[H("img",{class:"w-12 h-12 rounded-full",src:v.photo_url,alt:""},null,8,z7),H("span",null,ye(v.display_name),1),H("span",V7,ye(v.id),1)])]))),128))])):he("",!0)])):he("",!0)]))),256)),ue(we(We),{disabled:l.value.read_only,severity:"contrast",onClick:d,label:"Save"},null,8,["disabled"])])],64))}},E0=Il({id:"users",state:()=>({userIndex:[],currentUser:{},loading:!1}),getters:{isLoading:t=>t.loading},actions:{async getUsers(){this.loading=!0;const{data:t}=await kt.get("/admin/auth/users");return this.userIndex=t,this.loading=!1,t},async getUserByUid(t){this.loading=!0;const{data:e}=await kt.get(`/admin/auth/users/${t}`);return this.currentUser=e,this.loading=!1,e},async syncUsers(){this.loading=!0;try{return await kt.post("/admin/auth/sync-users"),{severity:"success",summary:"Users Synced",detail:"The users were synced successfully.",life:3e3}}catch{return{severity:"error",summary:"Users Sync Failed",detail:"Something went wrong when trying to sync the users. Please try again.",life:3e3}}finally{this.loading=!1}},async setUserRole(t,e){try{return await kt.post("/admin/auth/set-role",{uid:t,role:e}),{severity:"success",summary:"Role Updated",detail:`The user with ID ${t} has changed role.`,life:3e3}}catch(n){return console.error("Role privileges error:",n.message),{severity:"error",summary:"Role update failed",detail:"Something went wrong when trying change the user role. Please try again.",life:3e3}}},async deleteUser(t){try{return await kt.post(`/admin/auth/delete-user/${t}`),{severity:"success",summary:"User Deleted",detail:`The user with ID ${t} was deleted successfully.`,life:3e3}}catch(e){return console.error("User delete error:",e.message),{severity:"error",summary:"User Delete Failed",detail:"Something went wrong when trying to delete the user. Please try again.",life:3e3}}}}}),H7={key:0},q7={class:"flex justify-between"},K7={key:0},W7={class:"flex flex-col outline outline-1 outline-surface-200 rounded-lg shadow p-3 my-3 hover:shadow-lg"},Y7={class:"text-xs text-surface-600"},G7={key:1},Z7={key:2,class:"text-surface-500"},X7={__name:"UserIndex",setup(t){const e=E0(),n=Kn();e.getUsers();const r=Qe(()=>e.userIndex),o=async()=>{const i=await e.syncUsers();n.add(i)};return(i,a)=>{const l=De("router-link");return r.value?(R(),q("div",H7,[H("div",q7,[a[0]||(a[0]=H("h1",{class:"text-xl my-6"},"Users (Firebase)",-1)),ue(we(We),{onClick:o,label:"Sync users",class:"h-fit",size:"small",text:"",severity:"info",icon:"fas fa-sync"})]),a[2]||(a[2]=H("span",{class:"text-sm text-surface-600"},"This is the users list you'll find in Firebase. It may or may not match the users table in Supabase, but you can use the Sync button above to sync this with Supabase. ",-1)),H("div",null,[r.value&&r.value.length>0?(R(),q("ul",K7,[(R(!0),q(_e,null,ft(r.value,s=>(R(),q("li",{key:s.uid},[s.email!="firebase@flutterflow.io"?(R(),ke(l,{key:0,class:"w-full outline",to:`/firebase-users/${s.uid}`},{default:Se(()=>[H("div",W7,[H("span",null,ye(s.display_name||"Unnamed"),1),H("span",Y7,ye(s.email),1)])]),_:2},1032,["to"])):he("",!0)]))),128))])):we(e).isLoading?(R(),q("div",G7,[ue(we(Wl),{style:{width:"60px",height:"60px"},strokeWidth:"5"})])):(R(),q("div",Z7,a[1]||(a[1]=[H("p",null,"No items",-1)])))])])):he("",!0)}}};var O0={name:"BlankIcon",extends:pt};function J7(t,e,n,r,o,i){return R(),q("svg",$({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},t.pti()),e[0]||(e[0]=[H("rect",{width:"1",height:"1",fill:"currentColor","fill-opacity":"0"},null,-1)]),16)}O0.render=J7;var T0={name:"SearchIcon",extends:pt};function Q7(t,e,n,r,o,i){return R(),q("svg",$({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},t.pti()),e[0]||(e[0]=[H("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M2.67602 11.0265C3.6661 11.688 4.83011 12.0411 6.02086 12.0411C6.81149 12.0411 7.59438 11.8854 8.32483 11.5828C8.87005 11.357 9.37808 11.0526 9.83317 10.6803L12.9769 13.8241C13.0323 13.8801 13.0983 13.9245 13.171 13.9548C13.2438 13.985 13.3219 14.0003 13.4007 14C13.4795 14.0003 13.5575 13.985 13.6303 13.9548C13.7031 13.9245 13.7691 13.8801 13.8244 13.8241C13.9367 13.7116 13.9998 13.5592 13.9998 13.4003C13.9998 13.2414 13.9367 13.089 13.8244 12.9765L10.6807 9.8328C11.053 9.37773 11.3573 8.86972 11.5831 8.32452C11.8857 7.59408 12.0414 6.81119 12.0414 6.02056C12.0414 4.8298 11.6883 3.66579 11.0268 2.67572C10.3652 1.68564 9.42494 0.913972 8.32483 0.45829C7.22472 0.00260857 6.01418 -0.116618 4.84631 0.115686C3.67844 0.34799 2.60568 0.921393 1.76369 1.76338C0.921698 2.60537 0.348296 3.67813 0.115991 4.84601C-0.116313 6.01388 0.00291375 7.22441 0.458595 8.32452C0.914277 9.42464 1.68595 10.3649 2.67602 11.0265ZM3.35565 2.0158C4.14456 1.48867 5.07206 1.20731 6.02086 1.20731C7.29317 1.20731 8.51338 1.71274 9.41304 2.6124C10.3127 3.51206 10.8181 4.73226 10.8181 6.00457C10.8181 6.95337 10.5368 7.88088 10.0096 8.66978C9.48251 9.45868 8.73328 10.0736 7.85669 10.4367C6.98011 10.7997 6.01554 10.8947 5.08496 10.7096C4.15439 10.5245 3.2996 10.0676 2.62869 9.39674C1.95778 8.72583 1.50089 7.87104 1.31579 6.94046C1.13068 6.00989 1.22568 5.04532 1.58878 4.16874C1.95187 3.29215 2.56675 2.54292 3.35565 2.0158Z",fill:"currentColor"},null,-1)]),16)}T0.render=Q7;var e9=function(e){var n=e.dt;return`
+In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}var i,a=!0,l=!1;return{s:function(){n=n.call(t)},n:function(){var u=n.next();return a=u.done,u},e:function(u){l=!0,i=u},f:function(){try{a||n.return==null||n.return()}finally{if(l)throw i}}}}function _0(t,e){if(t){if(typeof t=="string")return ld(t,e);var n={}.toString.call(t).slice(8,-1);return n==="Object"&&t.constructor&&(n=t.constructor.name),n==="Map"||n==="Set"?Array.from(t):n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?ld(t,e):void 0}}function ld(t,e){(e==null||e>t.length)&&(e=t.length);for(var n=0,r=Array(e);n<e;n++)r[n]=t[n];return r}var I0={name:"FileUpload",extends:WT,inheritAttrs:!1,emits:["select","uploader","before-upload","progress","upload","error","before-send","clear","remove","remove-uploaded-file"],duplicateIEEvent:!1,data:function(){return{uploadedFileCount:0,files:[],messages:[],focused:!1,progress:null,uploadedFiles:[]}},methods:{upload:function(){this.hasFiles&&this.uploader()},onBasicUploaderClick:function(e){e.button===0&&this.$refs.fileInput.click()},onFileSelect:function(e){if(e.type!=="drop"&&this.isIE11()&&this.duplicateIEEvent){this.duplicateIEEvent=!1;return}this.isBasic&&this.hasFiles&&(this.files=[]),this.messages=[],this.files=this.files||[];var n=e.dataTransfer?e.dataTransfer.files:e.target.files,r=Cs(n),o;try{for(r.s();!(o=r.n()).done;){var i=o.value;this.isFileSelected(i)||this.validate(i)&&(this.isImage(i)&&(i.objectURL=window.URL.createObjectURL(i)),this.files.push(i))}}catch(a){r.e(a)}finally{r.f()}this.$emit("select",{originalEvent:e,files:this.files}),this.fileLimit&&this.checkFileLimit(),this.auto&&this.hasFiles&&!this.isFileLimitExceeded()&&this.uploader(),e.type!=="drop"&&this.isIE11()?this.clearIEInput():this.clearInputElement()},choose:function(){this.$refs.fileInput.click()},uploader:function(){var e=this;if(this.customUpload)this.fileLimit&&(this.uploadedFileCount+=this.files.length),this.$emit("uploader",{files:this.files}),this.clear();else{var n=new XMLHttpRequest,r=new FormData;this.$emit("before-upload",{xhr:n,formData:r});var o=Cs(this.files),i;try{for(o.s();!(i=o.n()).done;){var a=i.value;r.append(this.name,a,a.name)}}catch(l){o.e(l)}finally{o.f()}n.upload.addEventListener("progress",function(l){l.lengthComputable&&(e.progress=Math.round(l.loaded*100/l.total)),e.$emit("progress",{originalEvent:l,progress:e.progress})}),n.onreadystatechange=function(){if(n.readyState===4){var l;e.progress=0,n.status>=200&&n.status<300?(e.fileLimit&&(e.uploadedFileCount+=e.files.length),e.$emit("upload",{xhr:n,files:e.files})):e.$emit("error",{xhr:n,files:e.files}),(l=e.uploadedFiles).push.apply(l,fu(e.files)),e.clear()}},n.open("POST",this.url,!0),this.$emit("before-send",{xhr:n,formData:r}),n.withCredentials=this.withCredentials,n.send(r)}},clear:function(){this.files=[],this.messages=null,this.$emit("clear"),this.isAdvanced&&this.clearInputElement()},onFocus:function(){this.focused=!0},onBlur:function(){this.focused=!1},isFileSelected:function(e){if(this.files&&this.files.length){var n=Cs(this.files),r;try{for(n.s();!(r=n.n()).done;){var o=r.value;if(o.name+o.type+o.size===e.name+e.type+e.size)return!0}}catch(i){n.e(i)}finally{n.f()}}return!1},isIE11:function(){return!!window.MSInputMethodContext&&!!document.documentMode},validate:function(e){return this.accept&&!this.isFileTypeValid(e)?(this.messages.push(this.invalidFileTypeMessage.replace("{0}",e.name).replace("{1}",this.accept)),!1):this.maxFileSize&&e.size>this.maxFileSize?(this.messages.push(this.invalidFileSizeMessage.replace("{0}",e.name).replace("{1}",this.formatSize(this.maxFileSize))),!1):!0},isFileTypeValid:function(e){var n=this.accept.split(",").map(function(l){return l.trim()}),r=Cs(n),o;try{for(r.s();!(o=r.n()).done;){var i=o.value,a=this.isWildcard(i)?this.getTypeClass(e.type)===this.getTypeClass(i):e.type==i||this.getFileExtension(e).toLowerCase()===i.toLowerCase();if(a)return!0}}catch(l){r.e(l)}finally{r.f()}return!1},getTypeClass:function(e){return e.substring(0,e.indexOf("/"))},isWildcard:function(e){return e.indexOf("*")!==-1},getFileExtension:function(e){return"."+e.name.split(".").pop()},isImage:function(e){return/^image\//.test(e.type)},onDragEnter:function(e){this.disabled||(e.stopPropagation(),e.preventDefault())},onDragOver:function(e){this.disabled||(!this.isUnstyled&&si(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!0),e.stopPropagation(),e.preventDefault())},onDragLeave:function(){this.disabled||(!this.isUnstyled&&bo(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!1))},onDrop:function(e){if(!this.disabled){!this.isUnstyled&&bo(this.$refs.content,"p-fileupload-highlight"),this.$refs.content.setAttribute("data-p-highlight",!1),e.stopPropagation(),e.preventDefault();var n=e.dataTransfer?e.dataTransfer.files:e.target.files,r=this.multiple||n&&n.length===1;r&&this.onFileSelect(e)}},remove:function(e){this.clearInputElement();var n=this.files.splice(e,1)[0];this.files=fu(this.files),this.$emit("remove",{file:n,files:this.files})},removeUploadedFile:function(e){var n=this.uploadedFiles.splice(e,1)[0];this.uploadedFiles=fu(this.uploadedFiles),this.$emit("remove-uploaded-file",{file:n,files:this.uploadedFiles})},clearInputElement:function(){this.$refs.fileInput.value=""},clearIEInput:function(){this.$refs.fileInput&&(this.duplicateIEEvent=!0,this.$refs.fileInput.value="")},formatSize:function(e){var n,r=1024,o=3,i=((n=this.$primevue.config.locale)===null||n===void 0?void 0:n.fileSizeTypes)||["B","KB","MB","GB","TB","PB","EB","ZB","YB"];if(e===0)return"0 ".concat(i[0]);var a=Math.floor(Math.log(e)/Math.log(r)),l=parseFloat((e/Math.pow(r,a)).toFixed(o));return"".concat(l," ").concat(i[a])},isFileLimitExceeded:function(){return this.fileLimit&&this.fileLimit<=this.files.length+this.uploadedFileCount&&this.focused&&(this.focused=!1),this.fileLimit&&this.fileLimit<this.files.length+this.uploadedFileCount},checkFileLimit:function(){this.isFileLimitExceeded()&&this.messages.push(this.invalidFileLimitMessage.replace("{0}",this.fileLimit.toString()))},onMessageClose:function(){this.messages=null}},computed:{isAdvanced:function(){return this.mode==="advanced"},isBasic:function(){return this.mode==="basic"},chooseButtonClass:function(){return[this.cx("pcChooseButton"),this.class]},basicFileChosenLabel:function(){var e;if(this.auto)return this.chooseButtonLabel;if(this.hasFiles){var n;return this.files&&this.files.length===1?this.files[0].name:(n=this.$primevue.config.locale)===null||n===void 0||(n=n.fileChosenMessage)===null||n===void 0?void 0:n.replace("{0}",this.files.length)}return((e=this.$primevue.config.locale)===null||e===void 0?void 0:e.noFileChosenMessage)||""},hasFiles:function(){return this.files&&this.files.length>0},hasUploadedFiles:function(){return this.uploadedFiles&&this.uploadedFiles.length>0},chooseDisabled:function(){return this.disabled||this.fileLimit&&this.fileLimit<=this.files.length+this.uploadedFileCount},uploadDisabled:function(){return this.disabled||!this.hasFiles||this.fileLimit&&this.fileLimit<this.files.length},cancelDisabled:function(){return this.disabled||!this.hasFiles},chooseButtonLabel:function(){return this.chooseLabel||this.$primevue.config.locale.choose},uploadButtonLabel:function(){return this.uploadLabel||this.$primevue.config.locale.upload},cancelButtonLabel:function(){return this.cancelLabel||this.$primevue.config.locale.cancel},completedLabel:function(){return this.$primevue.config.locale.completed},pendingLabel:function(){return this.$primevue.config.locale.pending}},components:{Button:We,ProgressBar:S0,Message:x0,FileContent:C0,PlusIcon:w0,UploadIcon:k0,TimesIcon:Zr},directives:{ripple:Hn}},QT=["multiple","accept","disabled"],e7=["files"],t7=["accept","disabled","multiple"];function n7(t,e,n,r,o,i){var a=De("Button"),l=De("ProgressBar"),s=De("Message"),u=De("FileContent");return i.isAdvanced?(R(),q("div",$({key:0,class:t.cx("root")},t.ptmi("root")),[H("input",$({ref:"fileInput",type:"file",onChange:e[0]||(e[0]=function(){return i.onFileSelect&&i.onFileSelect.apply(i,arguments)}),multiple:t.multiple,accept:t.accept,disabled:i.chooseDisabled},t.ptm("input")),null,16,QT),H("div",$({class:t.cx("header")},t.ptm("header")),[ve(t.$slots,"header",{files:o.files,uploadedFiles:o.uploadedFiles,chooseCallback:i.choose,uploadCallback:i.uploader,clearCallback:i.clear},function(){return[ue(a,$({label:i.chooseButtonLabel,class:i.chooseButtonClass,style:t.style,disabled:t.disabled,unstyled:t.unstyled,onClick:i.choose,onKeydown:ot(i.choose,["enter"]),onFocus:i.onFocus,onBlur:i.onBlur},t.chooseButtonProps,{pt:t.ptm("pcChooseButton")}),{icon:Se(function(c){return[ve(t.$slots,"chooseicon",{},function(){return[(R(),ke($e(t.chooseIcon?"span":"PlusIcon"),$({class:[c.class,t.chooseIcon],"aria-hidden":"true"},t.ptm("pcChooseButton").icon),null,16,["class"]))]})]}),_:3},16,["label","class","style","disabled","unstyled","onClick","onKeydown","onFocus","onBlur","pt"]),t.showUploadButton?(R(),ke(a,$({key:0,class:t.cx("pcUploadButton"),label:i.uploadButtonLabel,onClick:i.uploader,disabled:i.uploadDisabled,unstyled:t.unstyled},t.uploadButtonProps,{pt:t.ptm("pcUploadButton")}),{icon:Se(function(c){return[ve(t.$slots,"uploadicon",{},function(){return[(R(),ke($e(t.uploadIcon?"span":"UploadIcon"),$({class:[c.class,t.uploadIcon],"aria-hidden":"true"},t.ptm("pcUploadButton").icon,{"data-pc-section":"uploadbuttonicon"}),null,16,["class"]))]})]}),_:3},16,["class","label","onClick","disabled","unstyled","pt"])):he("",!0),t.showCancelButton?(R(),ke(a,$({key:1,class:t.cx("pcCancelButton"),label:i.cancelButtonLabel,onClick:i.clear,disabled:i.cancelDisabled,unstyled:t.unstyled},t.cancelButtonProps,{pt:t.ptm("pcCancelButton")}),{icon:Se(function(c){return[ve(t.$slots,"cancelicon",{},function(){return[(R(),ke($e(t.cancelIcon?"span":"TimesIcon"),$({class:[c.class,t.cancelIcon],"aria-hidden":"true"},t.ptm("pcCancelButton").icon,{"data-pc-section":"cancelbuttonicon"}),null,16,["class"]))]})]}),_:3},16,["class","label","onClick","disabled","unstyled","pt"])):he("",!0)]})],16),H("div",$({ref:"content",class:t.cx("content"),onDragenter:e[1]||(e[1]=function(){return i.onDragEnter&&i.onDragEnter.apply(i,arguments)}),onDragover:e[2]||(e[2]=function(){return i.onDragOver&&i.onDragOver.apply(i,arguments)}),onDragleave:e[3]||(e[3]=function(){return i.onDragLeave&&i.onDragLeave.apply(i,arguments)}),onDrop:e[4]||(e[4]=function(){return i.onDrop&&i.onDrop.apply(i,arguments)})},t.ptm("content"),{"data-p-highlight":!1}),[ve(t.$slots,"content",{files:o.files,uploadedFiles:o.uploadedFiles,removeUploadedFileCallback:i.removeUploadedFile,removeFileCallback:i.remove,progress:o.progress,messages:o.messages},function(){return[i.hasFiles?(R(),ke(l,{key:0,value:o.progress,showValue:!1,unstyled:t.unstyled,pt:t.ptm("pcProgressbar")},null,8,["value","unstyled","pt"])):he("",!0),(R(!0),q(_e,null,ft(o.messages,function(c){return R(),ke(s,{key:c,severity:"error",onClose:i.onMessageClose,unstyled:t.unstyled,pt:t.ptm("pcMessage")},{default:Se(function(){return[gt(ye(c),1)]}),_:2},1032,["onClose","unstyled","pt"])}),128)),i.hasFiles?(R(),q("div",{key:1,class:je(t.cx("fileList"))},[ue(u,{files:o.files,onRemove:i.remove,badgeValue:i.pendingLabel,previewWidth:t.previewWidth,templates:t.$slots,unstyled:t.unstyled,pt:t.pt},null,8,["files","onRemove","badgeValue","previewWidth","templates","unstyled","pt"])],2)):he("",!0),i.hasUploadedFiles?(R(),q("div",{key:2,class:je(t.cx("fileList"))},[ue(u,{files:o.uploadedFiles,onRemove:i.removeUploadedFile,badgeValue:i.completedLabel,badgeSeverity:"success",previewWidth:t.previewWidth,templates:t.$slots,unstyled:t.unstyled,pt:t.pt},null,8,["files","onRemove","badgeValue","previewWidth","templates","unstyled","pt"])],2)):he("",!0)]}),t.$slots.empty&&!i.hasFiles&&!i.hasUploadedFiles?(R(),q("div",Ba($({key:0},t.ptm("empty"))),[ve(t.$slots,"empty")],16)):he("",!0)],16)],16)):i.isBasic?(R(),q("div",$({key:1,class:t.cx("root")},t.ptmi("root")),[(R(!0),q(_e,null,ft(o.messages,function(c){return R(),ke(s,{key:c,severity:"error",onClose:i.onMessageClose,unstyled:t.unstyled,pt:t.ptm("pcMessage")},{default:Se(function(){return[gt(ye(c),1)]}),_:2},1032,["onClose","unstyled","pt"])}),128)),ue(a,$({label:i.chooseButtonLabel,class:i.chooseButtonClass,style:t.style,disabled:t.disabled,unstyled:t.unstyled,onMouseup:i.onBasicUploaderClick,onKeydown:ot(i.choose,["enter"]),onFocus:i.onFocus,onBlur:i.onBlur},t.chooseButtonProps,{pt:t.ptm("pcChooseButton")}),{icon:Se(function(c){return[ve(t.$slots,"chooseicon",{},function(){return[(R(),ke($e(t.chooseIcon?"span":"PlusIcon"),$({class:[c.class,t.chooseIcon],"aria-hidden":"true"},t.ptm("pcChooseButton").icon),null,16,["class"]))]})]}),_:3},16,["label","class","style","disabled","unstyled","onMouseup","onKeydown","onFocus","onBlur","pt"]),t.auto?he("",!0):ve(t.$slots,"filelabel",{key:0,class:je(t.cx("filelabel"))},function(){return[H("span",{class:je(t.cx("filelabel")),files:o.files},ye(i.basicFileChosenLabel),11,e7)]}),H("input",$({ref:"fileInput",type:"file",accept:t.accept,disabled:t.disabled,multiple:t.multiple,onChange:e[5]||(e[5]=function(){return i.onFileSelect&&i.onFileSelect.apply(i,arguments)}),onFocus:e[6]||(e[6]=function(){return i.onFocus&&i.onFocus.apply(i,arguments)}),onBlur:e[7]||(e[7]=function(){return i.onBlur&&i.onBlur.apply(i,arguments)})},t.ptm("input")),null,16,t7)],16)):he("",!0)}I0.render=n7;const r7={class:"card"},o7={class:"flex flex-wrap justify-between items-center flex-1 gap-4"},i7={class:"flex gap-2"},a7={class:"flex flex-col gap-8 pt-4"},s7={key:0},l7={class:"flex flex-wrap gap-4"},c7=["alt","src"],u7={class:"font-semibold text-ellipsis max-w-60 whitespace-nowrap overflow-hidden"},d7={key:1},f7={class:"flex flex-wrap gap-4"},p7=["alt","src"],h7={class:"font-semibold text-ellipsis max-w-60 whitespace-nowrap overflow-hidden"},m7={__name:"ImageUploader",emits:["upload-complete"],setup(t,{emit:e}){const n=e,r=Bk(),o=Kn(),i=tt(0),a=tt(0),l=tt([]),s=(f,p,h)=>{p(h),i.value-=parseInt(d(f.size)),a.value=i.value/10},u=f=>{l.value=f.files,l.value.forEach(p=>{i.value+=parseInt(d(p.size))})},c=async f=>{try{const p=new FormData;l.value.forEach(m=>{p.append("image",m)});const h=await kt.post("/cloudinary-upload",p,{headers:{"Content-Type":"multipart/form-data"}});h.data&&(o.add({severity:"success",summary:"Success",detail:"Files uploaded successfully",life:3e3}),n("upload-complete",h.data))}catch(p){o.add({severity:"error",summary:"Error",detail:p.message||"Failed to upload files",life:3e3})}};function d(f){const m=r.config.locale.fileSizeTypes;if(f===0)return`0 ${m[0]}`;const v=Math.floor(Math.log(f)/Math.log(1024));return`${parseFloat((f/Math.pow(1024,v)).toFixed(3))} ${m[v]}`}return(f,p)=>(R(),q("div",r7,[ue(we(I0),{name:"image",multiple:!1,accept:"image/*",maxFileSize:1e6,onSelect:u,onUpload:p[0]||(p[0]=h=>c())},{header:Se(({chooseCallback:h,uploadCallback:m,clearCallback:v,files:y})=>[H("div",o7,[H("div",i7,[ue(we(We),{onClick:b=>h(),icon:"fa fa-images",rounded:"",outlined:"",severity:"info"},null,8,["onClick"]),ue(we(We),{onClick:b=>c(m),icon:"fa fa-cloud-upload",rounded:"",outlined:"",severity:"success",disabled:!y||y.length===0},null,8,["onClick","disabled"]),ue(we(We),{onClick:b=>v(),icon:"fa fa-times",rounded:"",outlined:"",severity:"danger",disabled:!y||y.length===0},null,8,["onClick","disabled"])])])]),content:Se(({files:h,uploadedFiles:m,removeUploadedFileCallback:v,removeFileCallback:y})=>[H("div",a7,[h.length>0?(R(),q("div",s7,[p[1]||(p[1]=H("h5",null,"Pending",-1)),H("div",l7,[(R(!0),q(_e,null,ft(h,(b,w)=>(R(),q("div",{key:b.name+b.type+b.size,class:"p-8 rounded-border flex flex-col border border-surface items-center gap-4"},[H("div",null,[H("img",{role:"presentation",alt:b.name,src:b.objectURL,width:"100",height:"50"},null,8,c7)]),H("span",u7,ye(b.name),1),H("div",null,ye(d(b.size)),1),ue(we(ii),{value:"Pending",severity:"warn"}),ue(we(We),{icon:"fa fa-times",onClick:g=>s(b,y,w),outlined:"",rounded:"",severity:"danger"},null,8,["onClick"])]))),128))])])):he("",!0),m.length>0?(R(),q("div",d7,[p[2]||(p[2]=H("h5",null,"Completed",-1)),H("div",f7,[(R(!0),q(_e,null,ft(m,(b,w)=>(R(),q("div",{key:b.name+b.type+b.size,class:"p-8 rounded-border flex flex-col border border-surface items-center gap-4"},[H("div",null,[H("img",{role:"presentation",alt:b.name,src:b.objectURL,width:"100",height:"50"},null,8,p7)]),H("span",h7,ye(b.name),1),H("div",null,ye(d(b.size)),1),ue(we(ii),{value:"Completed",class:"mt-4",severity:"success"}),ue(we(We),{icon:"fa fa-times",onClick:g=>v(w),outlined:"",rounded:"",severity:"danger"},null,8,["onClick"])]))),128))])])):he("",!0)])]),empty:Se(()=>p[3]||(p[3]=[H("div",{class:"flex items-center justify-center flex-col"},[H("i",{class:"fa fa-cloud-upload !border-2 !rounded-full !p-4 !text-xl"}),H("p",{class:"mt-6 mb-0 text-surface-600"},"Drag and drop files to here to upload.")],-1)])),_:1})]))}},g7={class:"my-6 w-full flex justify-between"},b7={class:"text-xl"},v7={class:"text-xl"},y7={class:"text-xs text-surface-500"},w7={class:"flex flex-col gap-4 w-full max-w-xl"},k7={class:"my-6"},x7={key:0},S7={key:0,class:"flex flex-col"},C7={class:"text-surface-600"},_7={key:1,class:"flex flex-col"},I7={class:"text-surface-600"},E7={key:2,class:"flex flex-col"},O7={class:"text-surface-600"},T7={key:3,class:"flex flex-col"},A7={class:"text-surface-600"},P7={key:4,class:"flex flex-col"},L7={class:"text-surface-600"},D7={key:5,class:"flex flex-col"},R7={class:"text-surface-600"},B7={class:"md:flex justify-between"},M7=["src"],N7={key:6,class:"flex flex-col"},$7={class:"text-surface-600"},F7={key:0,class:"text-xs text-surface-600"},j7={class:"flex flex-col items-center justify-center shadow rounded-lg p-2"},z7=["src"],V7={class:"text-[0.6rem] text-surface-400"},U7={__name:"DatabaseEntityDetail",setup(t){const e=dt(),n=Kn(),r=tt({}),o=za(),i=ja(),a=o0(),l=tt({}),s=Hd();Un(async()=>{await u()});const u=async()=>{l.value=e.dashboardConfig.models.find(p=>p.collection_name===o.params.entity),r.value=await a.getDatabaseEntityDetail(o.params.entity,o.params.id)},c=(p,h)=>{r.value[h]=p},d=async()=>{const p=await a.upsertDatabaseEntity(o.params.entity,o.params.id,r.value);o.params.id==="create"&&i.push(`/${o.params.entity}`),n.add(p)},f=async()=>{s.require({header:"Confirm Delete",message:"Are you sure you want to delete this database entry?",icon:"fa-solid fa-exclamation-circle",rejectLabel:"Cancel",confirmLabel:"Confirm",accept:async()=>{const p=await a.deleteDatabaseEntity(o.params.entity,o.params.id);n.add(p),i.push(`/${o.params.entity}`)}})};return(p,h)=>(R(),q(_e,null,[H("div",g7,[H("div",b7,[H("h1",v7,ye(l.value.display_name)+" document ",1),H("span",y7,"Database ID => "+ye(we(o).params.id),1)]),l.value.read_only?he("",!0):(R(),ke(we(We),{key:0,onClick:f,icon:"fa-solid fa-trash text-red-600",text:""}))]),H("div",w7,[(R(!0),q(_e,null,ft(l.value.fields,m=>(R(),q("div",k7,[m&&r.value?(R(),q("div",x7,[m.type==="String"?(R(),q("div",S7,[H("label",C7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(Io),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Date"?(R(),q("div",_7,[H("label",I7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(y0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,dateFormat:"yy-mm-dd"},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Boolean"?(R(),q("div",E7,[H("label",O7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(p0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,binary:""},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Integer"?(R(),q("div",T7,[H("label",A7,ye(m.fieldName.replace(/_/g," ")),1),ue(we(d0),{modelValue:r.value[m.fieldName],"onUpdate:modelValue":v=>r.value[m.fieldName]=v,inputId:"integeronly",fluid:""},null,8,["modelValue","onUpdate:modelValue"])])):m.type==="Raw"?(R(),q("div",P7,[H("label",L7,ye(m.fieldName.replace(/_/g," ")),1),gt(" "+ye(r.value[m.fieldName]),1)])):m.type==="Image"?(R(),q("div",D7,[H("label",R7,ye(m.fieldName.replace(/_/g," ")),1),H("div",B7,[r.value[m.fieldName]?(R(),q("img",{key:0,class:"w-40 h-40 rounded-full",src:r.value[m.fieldName].public_url,alt:""},null,8,M7)):he("",!0),ue(m7,{onUploadComplete:v=>c(v,m.fieldName)},null,8,["onUploadComplete"])])])):m.type==="FirebaseUserList"?(R(),q("div",N7,[H("label",$7,ye(m.fieldName.replace(/_/g," ")),1),r.value[m.fieldName]&&r.value[m.fieldName].length==0?(R(),q("div",F7,"None")):he("",!0),(R(!0),q(_e,null,ft(r.value[m.fieldName],v=>(R(),q("div",{key:v.id,class:"grid grid-cols-2 md:grid-cols-3"},[H("div",j7,[H("img",{class:"w-12 h-12 rounded-full",src:v.photo_url,alt:""},null,8,z7),H("span",null,ye(v.display_name),1),H("span",V7,ye(v.id),1)])]))),128))])):he("",!0)])):he("",!0)]))),256)),ue(we(We),{disabled:l.value.read_only,severity:"contrast",onClick:d,label:"Save"},null,8,["disabled"])])],64))}},E0=Il({id:"users",state:()=>({userIndex:[],currentUser:{},loading:!1}),getters:{isLoading:t=>t.loading},actions:{async getUsers(){this.loading=!0;const t=[];let e=null;do{const n=await kt.get("/admin/auth/users",{params:e?{page_token:e}:{}});t.push(...n.data),e=n.headers["x-next-page-token"]}while(e);return this.userIndex=t,this.loading=!1,t},async getUserByUid(t){this.loading=!0;const{data:e}=await kt.get(`/admin/auth/users/${t}`);return this.currentUser=e,this.loading=!1,e},async syncUsers(){this.loading=!0;try{return await kt.post("/admin/auth/sync-users"),{severity:"success",summary:"Users Synced",detail:"The users were synced successfully.",life:3e3}}catch{return{severity:"error",summary:"Users Sync Failed",detail:"Something went wrong when trying to sync the users. Please try again.",life:3e3}}finally{this.loading=!1}},async setUserRole(t,e){try{return await kt.post("/admin/auth/set-role",{uid:t,role:e}),{severity:"success",summary:"Role Updated",detail:`The user with ID ${t} has changed role.`,life:3e3}}catch(n){return console.error("Role privileges error:",n.message),{severity:"error",summary:"Role update failed",detail:"Something went wrong when trying change the user role. Please try again.",life:3e3}}},async deleteUser(t){try{return await kt.post(`/admin/auth/delete-user/${t}`),{severity:"success",summary:"User Deleted",detail:`The user with ID ${t} was deleted successfully.`,life:3e3}}catch(e){return console.error("User delete error:",e.message),{severity:"error",summary:"User Delete Failed",detail:"Something went wrong when trying to delete the user. Please try again.",life:3e3}}}}}),H7={key:0},q7={class:"flex justify-between"},K7={key:0},W7={class:"flex flex-col outline outline-1 outline-surface-200 rounded-lg shadow p-3 my-3 hover:shadow-lg"},Y7={class:"text-xs text-surface-600"},G7={key:1},Z7={key:2,class:"text-surface-500"},X7={__name:"UserIndex",setup(t){const e=E0(),n=Kn();e.getUsers();const r=Qe(()=>e.userIndex),o=async()=>{const i=await e.syncUsers();n.add(i)};return(i,a)=>{const l=De("router-link");return r.value?(R(),q("div",H7,[H("div",q7,[a[0]||(a[0]=H("h1",{class:"text-xl my-6"},"Users (Firebase)",-1)),ue(we(We),{onClick:o,label:"Sync users",class:"h-fit",size:"small",text:"",severity:"info",icon:"fas fa-sync"})]),a[2]||(a[2]=H("span",{class:"text-sm text-surface-600"},"This is the users list you'll find in Firebase. It may or may not match the users table in Supabase, but you can use the Sync button above to sync this with Supabase. ",-1)),H("div",null,[r.value&&r.value.length>0?(R(),q("ul",K7,[(R(!0),q(_e,null,ft(r.value,s=>(R(),q("li",{key:s.uid},[s.email!="firebase@flutterflow.io"?(R(),ke(l,{key:0,class:"w-full outline",to:`/firebase-users/${s.uid}`},{default:Se(()=>[H("div",W7,[H("span",null,ye(s.display_name||"Unnamed"),1),H("span",Y7,ye(s.email),1)])]),_:2},1032,["to"])):he("",!0)]))),128))])):we(e).isLoading?(R(),q("div",G7,[ue(we(Wl),{style:{width:"60px",height:"60px"},strokeWidth:"5"})])):(R(),q("div",Z7,a[1]||(a[1]=[H("p",null,"No items",-1)])))])])):he("",!0)}}};var O0={name:"BlankIcon",extends:pt};function J7(t,e,n,r,o,i){return R(),q("svg",$({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},t.pti()),e[0]||(e[0]=[H("rect",{width:"1",height:"1",fill:"currentColor","fill-opacity":"0"},null,-1)]),16)}O0.render=J7;var T0={name:"SearchIcon",extends:pt};function Q7(t,e,n,r,o,i){return R(),q("svg",$({width:"14",height:"14",viewBox:"0 0 14 14",fill:"none",xmlns:"http://www.w3.org/2000/svg"},t.pti()),e[0]||(e[0]=[H("path",{"fill-rule":"evenodd","clip-rule":"evenodd",d:"M2.67602 11.0265C3.6661 11.688 4.83011 12.0411 6.02086 12.0411C6.81149 12.0411 7.59438 11.8854 8.32483 11.5828C8.87005 11.357 9.37808 11.0526 9.83317 10.6803L12.9769 13.8241C13.0323 13.8801 13.0983 13.9245 13.171 13.9548C13.2438 13.985 13.3219 14.0003 13.4007 14C13.4795 14.0003 13.5575 13.985 13.6303 13.9548C13.7031 13.9245 13.7691 13.8801 13.8244 13.8241C13.9367 13.7116 13.9998 13.5592 13.9998 13.4003C13.9998 13.2414 13.9367 13.089 13.8244 12.9765L10.6807 9.8328C11.053 9.37773 11.3573 8.86972 11.5831 8.32452C11.8857 7.59408 12.0414 6.81119 12.0414 6.02056C12.0414 4.8298 11.6883 3.66579 11.0268 2.67572C10.3652 1.68564 9.42494 0.913972 8.32483 0.45829C7.22472 0.00260857 6.01418 -0.116618 4.84631 0.115686C3.67844 0.34799 2.60568 0.921393 1.76369 1.76338C0.921698 2.60537 0.348296 3.67813 0.115991 4.84601C-0.116313 6.01388 0.00291375 7.22441 0.458595 8.32452C0.914277 9.42464 1.68595 10.3649 2.67602 11.0265ZM3.35565 2.0158C4.14456 1.48867 5.07206 1.20731 6.02086 1.20731C7.29317 1.20731 8.51338 1.71274 9.41304 2.6124C10.3127 3.51206 10.8181 4.73226 10.8181 6.00457C10.8181 6.95337 10.5368 7.88088 10.0096 8.66978C9.48251 9.45868 8.73328 10.0736 7.85669 10.4367C6.98011 10.7997 6.01554 10.8947 5.08496 10.7096C4.15439 10.5245 3.2996 10.0676 2.62869 9.39674C1.95778 8.72583 1.50089 7.87104 1.31579 6.94046C1.13068 6.00989 1.22568 5.04532 1.58878 4.16874C1.95187 3.29215 2.56675 2.54292 3.35565 2.0158Z",fill:"currentColor"},null,-1)]),16)}T0.render=Q7;var e9=function(e){var n=e.dt;return`
 .p-iconfield {
     position: relative;
 }
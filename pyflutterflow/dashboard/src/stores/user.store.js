@@ -16,10 +16,18 @@ export const useUserStore = defineStore({
   actions: {
     async getUsers() {
       this.loading = true
-      const { data } = await api.get('/admin/auth/users')
-      this.userIndex = data
+      // The users list is paged; keep following the next page token until there is none
+      const users = []
+      let pageToken = null
+      do {
+        const params = pageToken ? { page_token: pageToken } : {}
+        const response = await api.get('/admin/auth/users', { params })
+        users.push(...response.data)
+        pageToken = response.headers['x-next-page-token']
+      } while (pageToken)
+      this.userIndex = users
       this.loading = false
-      return data
+      return users
     },
 
     async getUserByUid(userID) {
@@ -18,7 +18,7 @@ class FirestoreModel(BaseModel):
     async def fs_create(self) -> 'FirestoreModel':
         collection = self.get_collection()
         doc_ref = collection.document(self.id)
-        await doc_ref.set(self.to_dict())
+        await doc_ref.set(self.model_dump())
         return self
 
     async def fs_delete(self) -> None:
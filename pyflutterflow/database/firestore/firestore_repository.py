@@ -1,5 +1,6 @@
 from typing import Generic
 from beanie import PydanticObjectId
+from google.cloud.firestore_v1.async_transaction import async_transactional
 from pyflutterflow.paginator import Params, Page
 from pyflutterflow.database.firestore.firestore_client import FirestoreClient
 from pyflutterflow.database.interface import BaseRepositoryInterface
@@ -11,6 +12,24 @@ from pyflutterflow import constants
 logger = get_logger(__name__)
 
 
+@async_transactional
+async def delete_if_owned(transaction, doc_ref, current_user: FirebaseUser) -> None:
+    """
+    Read only the document's user_id inside a transaction, check ownership, and delete it
+    in the same commit. Admins may delete any document.
+    """
+    snapshot = await doc_ref.get(field_paths=['user_id'], transaction=transaction)
+    if not snapshot.exists:
+        raise ValueError("Record not found")
+    owner_id = (snapshot.to_dict() or {}).get('user_id')
+    if not owner_id:
+        raise ValueError("Firestore document does not have a user_id field")
+    if owner_id != current_user.uid and current_user.role != constants.ADMIN_ROLE:
+        logger.warning(f"An attempt was made to delete a firestore record not owned by the current user. User: {current_user.uid}, Record: {snapshot.id}")
+        raise ValueError("Attempted to delete a record without privileges.")
+    transaction.delete(doc_ref)
+
+
 class FirestoreRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, UpdateSchemaType], Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def __init__(self, model: type[ModelType]):
@@ -24,7 +43,7 @@ class FirestoreRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, U
         raise NotImplementedError("Firestore paginated lists are not yet available in this Python API")
 
     async def get(self, pk: str, current_user: FirebaseUser) -> ModelType:
-        doc_ref = self.collection.document(id)
+        doc_ref = self.collection.document(pk)
         doc = await doc_ref.get()
         if not doc.exists:
             raise ValueError
@@ -36,17 +55,43 @@ class FirestoreRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, U
             raise ValueError("Attempted to access a record without privileges.")
         return self.model(**data)
 
+    async def get_many(self, pks: list[str], current_user: FirebaseUser) -> list[ModelType]:
+        """
+        Retrieves several documents in a single batched read. Order is not guaranteed.
+
+        Unlike get(), which raises for a missing or unowned document, missing documents and
+        documents the current user does not own are skipped, so one bad id does not fail the
+        whole batch. As in get(), a document without a user_id field raises a ValueError.
+        """
+        if not pks:
+            return []
+        doc_refs = [self.collection.document(pk) for pk in pks]
+        items = []
+        async for doc in self.db.get_all(doc_refs):
+            if not doc.exists:
+                continue
+            data = doc.to_dict()
+            if not data.get('user_id'):
+                raise ValueError("Firestore document does not have a user_id field")
+            if data.get('user_id') != current_user.uid and current_user.role != constants.ADMIN_ROLE:
+                logger.warning(f"An attempt was made to retrieve a firestore record not owned by the current user. User: {current_user.uid}, Record: {doc.id}")
+                continue
+            items.append(self.model(**data))
+        return items
+
     async def create(self, data: CreateSchemaType, current_user: FirebaseUser, **kwargs) -> ModelType:
-        data = data.to_dict()
-        data['user_id'] = current_user.uid
-        data['id'] = kwargs.get('id', str(PydanticObjectId()))
-        return await self.model(**data).fs_create()
+        # The create schema has already been validated, and user_id and id are set server-side.
+        # Unset fields are kept so that the create schema's defaults reach the model.
+        payload = data.model_dump()
+        payload['user_id'] = current_user.uid
+        payload['id'] = kwargs.get('id') or str(PydanticObjectId())
+        return await self.model.model_construct(**payload).fs_create()
 
     async def update(self, pk: str, data: UpdateSchemaType, current_user: FirebaseUser) -> ModelType:
-        doc_ref = self.collection.document(id)
-        await doc_ref.update(data.to_dict())
+        doc_ref = self.collection.document(pk)
+        await doc_ref.update(data.model_dump(exclude_unset=True))
         return data
 
     async def delete(self, pk: str, current_user: FirebaseUser) -> None:
-        document = await self.get(id, current_user)
-        await document.fs_delete()
+        doc_ref = self.collection.document(pk)
+        await delete_if_owned(self.db.transaction(), doc_ref, current_user)
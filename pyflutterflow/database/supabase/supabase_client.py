@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from supabase._async.client import AsyncClient, create_client
 from pyflutterflow.logs import get_logger
 from pyflutterflow import PyFlutterflow
@@ -15,29 +17,35 @@ class SupabaseClient:
     """
 
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls):
+        """
+        Return the shared instance, creating it on first use. Settings are read once,
+        under a lock, so repeated calls on the hot path are a single attribute check.
+        """
         if cls._instance is None:
-            cls._instance = super(SupabaseClient, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(SupabaseClient, cls).__new__(cls)
+                    settings = PyFlutterflow().get_settings()
+                    instance.supabase_url = settings.supabase_url
+                    instance.supabase_secret_key = settings.supabase_secret_key
+                    instance.supabase_jwt_secret = settings.supabase_jwt_secret
+                    instance._client = None
+                    instance._client_lock = asyncio.Lock()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        """Initialize environment settings and placeholders for Supabase client."""
-        if not hasattr(self, '_initialized'):  # Prevent reinitialization on multiple calls
-            settings = PyFlutterflow().get_settings()
-            self.supabase_url = settings.supabase_url
-            self.supabase_secret_key = settings.supabase_secret_key
-            self.supabase_jwt_secret = settings.supabase_jwt_secret
-            self._client: AsyncClient | None = None
-            self._initialized = True  # Flag to indicate instance has been initialized
-
     async def initialize_client(self) -> None:
         """
-        Initializes the Supabase Client instance asynchronously.
+        Initializes the Supabase Client instance asynchronously. The lock ensures concurrent
+        first requests share a single client rather than each creating their own.
         """
-        if self._client is None:
-            self._client = await create_client(self.supabase_url, self.supabase_secret_key)
-            logger.info("Supabase Client initialized.")
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await create_client(self.supabase_url, self.supabase_secret_key)
+                logger.info("Supabase Client initialized.")
 
     async def get_client(self) -> AsyncClient:
         """
@@ -1,4 +1,5 @@
-from datetime import datetime, timezone, timedelta
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from cachetools import TTLCache
 from fastapi import Request, Response, Depends
 import jwt
@@ -12,6 +13,32 @@ from pyflutterflow.database.supabase.supabase_client import SupabaseClient
 
 logger = get_logger(__name__)
 token_cache = TTLCache(maxsize=100, ttl=300)
+JWT_LIFETIME_SECONDS = 30 * 24 * 60 * 60
+
+# Shared by all proxied requests so that connections to Supabase are kept alive and reused.
+_proxy_client: httpx.AsyncClient | None = None
+
+
+def get_proxy_client() -> httpx.AsyncClient:
+    """
+    Returns the shared proxy HTTP client, creating it on first use or after it has been closed.
+
+    The client is shared between users, so its cookie jar refuses every cookie. Otherwise a
+    Set-Cookie from Supabase would be replayed on other users' proxied requests.
+    """
+    global _proxy_client
+    if _proxy_client is None or _proxy_client.is_closed:
+        _proxy_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+    return _proxy_client
+
+
+async def close_proxy_client() -> None:
+    """Closes the shared proxy HTTP client. Call this from the application's shutdown hook."""
+    if _proxy_client is not None:
+        await _proxy_client.aclose()
 
 
 def generate_jwt(user_id, is_admin: bool = False) -> str:
@@ -27,13 +54,14 @@ def generate_jwt(user_id, is_admin: bool = False) -> str:
     """
     logger.debug("Generating supabase JWT token for user %s. Is Admin: %s", user_id, is_admin)
     settings = PyFlutterflow().get_settings()
+    now = int(time.time())
     payload = {
         "sub": user_id,
         "user_id": user_id,
         "iss": "supabase",
         "role": "admin" if is_admin else 'authenticated',
-        "iat": int((datetime.now(timezone.utc)).timestamp()),
-        "exp": int((datetime.now(timezone.utc) + timedelta(days=30)).timestamp()),
+        "iat": now,
+        "exp": now + JWT_LIFETIME_SECONDS,
     }
     return jwt.encode(payload, settings.supabase_jwt_secret, algorithm='HS256')
 
@@ -49,11 +77,12 @@ def get_token(user_id: str, role: str = '') -> str:
     Returns:
         dict: A dictionary containing the 'Authorization' header with the Bearer token.
     """
-    if user_id in token_cache:
-        jwt_token = token_cache[user_id]
-    else:
-        jwt_token = generate_jwt(user_id, is_admin=role == constants.ADMIN_ROLE)
-        token_cache[user_id] = jwt_token
+    is_admin = role == constants.ADMIN_ROLE
+    cache_key = (user_id, is_admin)
+    jwt_token = token_cache.get(cache_key)
+    if jwt_token is None:
+        jwt_token = generate_jwt(user_id, is_admin=is_admin)
+        token_cache[cache_key] = jwt_token
     return jwt_token
 
 
@@ -97,14 +126,13 @@ async def supabase_request(request: Request, path: str, current_user: FirebaseUs
     headers['apikey'] = settings.supabase_anon_key
 
     # Forward the request to Supabase
-    async with httpx.AsyncClient() as client:
-        supabase_response = await client.request(
-            method=request.method,
-            url=supabase_url,
-            params=query_params,
-            headers=headers,
-            content=await request.body(),
-        )
+    supabase_response = await get_proxy_client().request(
+        method=request.method,
+        url=supabase_url,
+        params=query_params,
+        headers=headers,
+        content=await request.body(),
+    )
 
     content = supabase_response.content.decode('utf-8', errors='replace')
     return Response(
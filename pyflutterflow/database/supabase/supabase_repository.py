@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pydantic import TypeAdapter
 from postgrest.exceptions import APIError
 from pyflutterflow.paginator import Params, Page
 from pyflutterflow.database.supabase.supabase_client import SupabaseClient
@@ -10,6 +12,30 @@ from pyflutterflow.logs import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def resolve_table_name(model: type) -> str:
+    """
+    Returns the table name from the model's Settings class, checked once per model class.
+
+    Raises:
+        ValueError: If the model does not have a Settings class with a 'name' attribute.
+    """
+    if not hasattr(model, "Settings") or not getattr(model.Settings, "name", None):
+        raise ValueError(
+            "Model does not have a Settings class. Tables must be named within a Settings class in the model."
+        )
+    return model.Settings.name
+
+
+@lru_cache(maxsize=None)
+def get_list_adapter(model: type) -> TypeAdapter:
+    """
+    Returns a TypeAdapter that validates a whole list of rows in one call. Building the
+    adapter compiles a schema, so one is kept per model class rather than per repository.
+    """
+    return TypeAdapter(list[model])
+
+
 class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     A repository class for interacting with Supabase, providing CRUD operations for a given model.
@@ -26,11 +52,8 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
             ValueError: If the model does not have a Settings class with a 'name' attribute.
         """
         self.model = model
-        if not hasattr(model, "Settings") or not getattr(model.Settings, "name", None):
-            raise ValueError(
-                "Model does not have a Settings class. Tables must be named within a Settings class in the model."
-            )
-        self.table_name = model.Settings.name
+        self.table_name = resolve_table_name(model)
+        self.list_adapter = get_list_adapter(model)
         self.supabase = SupabaseClient()
 
     def paginator(self, params: Params):
@@ -47,7 +70,7 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
         end = start + params.size - 1
         return start, end
 
-    async def build_paginated_query(self, params: Params, current_user: FirebaseUser, sql_query: str, auth: bool = True) -> Page[ModelType]:
+    async def build_paginated_query(self, params: Params, current_user: FirebaseUser, sql_query: str, auth: bool = True, count_mode: str = "exact") -> Page[ModelType]:
         """
         Builds a paginated query for fetching records, optionally with authentication headers.
 
@@ -56,6 +79,7 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
             current_user (FirebaseUser): The currently authenticated user.
             sql_query (str): The SQL query string for selecting fields.
             auth (bool): Whether to include authentication headers in the query.
+            count_mode (str): The PostgREST count mode: 'exact', 'planned' or 'estimated'.
 
         Returns:
             Any: The constructed query object ready for execution.
@@ -66,7 +90,7 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
         pager = self.paginator(params)
         query = (
             client.table(self.table_name)
-            .select(sql_query, count="exact")
+            .select(sql_query, count=count_mode)
             .range(*pager)
         )
 
@@ -135,7 +159,7 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
             query.headers.update({"Authorization": f"Bearer {token}"})
 
         response = await query.execute()
-        items = [self.model(**item) for item in response.data]
+        items = self.list_adapter.validate_python(response.data)
         return Page.create(items=items, total=response.count, params=Params())
 
     async def list_all(self, params: Params, current_user: FirebaseUser, **kwargs) -> Page[ModelType]:
@@ -149,14 +173,23 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
                 - sql_query (str, optional): The SQL query string for selecting fields. Defaults to '*'.
                 - auth (bool, optional): Whether to include authentication headers in the query. Defaults to True.
                 - sort_by (str, optional): The field name to sort the records by.
+                - count_mode (str, optional): The PostgREST count mode. Defaults to 'exact' on the
+                  first page and 'estimated' on later pages, which avoids a full COUNT(*) scan
+                  on large tables while keeping small totals exact.
+                - return_raw (bool, optional): Return the list of row dicts as-is, without a Page.
+                - raw_page (bool, optional): Return a Page whose items are the row dicts from Supabase,
+                  skipping model validation. Model invariants are not enforced in this mode, so only
+                  use it where the rows go straight back out as JSON. Defaults to False.
 
         Returns:
             Page[ModelType]: A paginated list of records.
         """
         sql_query = kwargs.get('sql_query', '*')
         return_raw = kwargs.get('return_raw', False)
+        raw_page = kwargs.get('raw_page', False)
         auth = kwargs.get('auth', True)
-        query = await self.build_paginated_query(params, current_user, sql_query, auth)
+        count_mode = kwargs.get('count_mode') or ("exact" if params.page == 0 else "estimated")
+        query = await self.build_paginated_query(params, current_user, sql_query, auth, count_mode)
 
         if kwargs.get("sort_by"):
             query = query.order(kwargs.get("sort_by"))
@@ -170,8 +203,10 @@ class SupabaseRepository(BaseRepositoryInterface[ModelType, CreateSchemaType, Up
 
         if return_raw:
             return response.data
+        elif raw_page:
+            return Page.create(items=response.data, total=response.count, params=params)
         else:
-            items = [self.model(**item) for item in response.data]
+            items = self.list_adapter.validate_python(response.data)
             return Page.create(items=items, total=response.count, params=params)
 
 
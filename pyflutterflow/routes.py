@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, UploadFile, File
-from starlette.responses import FileResponse
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from fastapi import APIRouter, Depends, UploadFile, File, Request, Response, status
 from pyflutterflow.logs import get_logger
 from pyflutterflow import PyFlutterflow
 from pyflutterflow.auth import (set_user_role, get_users_list, get_current_user, get_firebase_user_by_uid, delete_user,
@@ -20,17 +22,30 @@ router = APIRouter(
 router.include_router(webpages_router)
 router.include_router(notifications_router)
 
+
+@lru_cache(maxsize=2)
+def load_admin_config(file_path: str) -> tuple[bytes, str]:
+    """Read the dashboard config file once, returning its contents and an ETag for them."""
+    content = Path(file_path).read_bytes()
+    return content, f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+
+
 @router.get("/configure")
-async def serve_vue_config():
+async def serve_vue_config(request: Request):
     """
     This route serves configuration for the Vue.js admin dashboard.
 
     The dashboard consumes this configuration to connect to the Firebase and Supabase APIs,
-    and to handle the correct database schema.
+    and to handle the correct database schema. The file is read once per process and
+    served from memory, with an ETag so that unchanged configs get a 304.
     """
     settings = PyFlutterflow().get_settings()
     file_path = "admin_config.dev.json" if settings.environment == constants.DEV_ENVIRONMENT else "admin_config.json"
-    return FileResponse(file_path)
+    content, etag = load_admin_config(file_path)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 ########### Firebase auth routes ##############
@@ -50,9 +65,10 @@ async def set_role(_: FirebaseUser = Depends(set_user_role)) -> None:
 @router.get("/admin/auth/users", response_model=list[FirebaseAuthUser])
 async def get_users(users: list = Depends(get_users_list)):
     """
-    Get a list of all Firebase users. This route is only accessible to admins.
+    Get a page of Firebase users (up to 1000, set with 'page_size'). This route is only
+    accessible to admins. Pass the X-Next-Page-Token response header back as 'page_token'
+    to fetch the next page.
     """
-    # TODO users pagination
     return users
 
 
@@ -5,6 +5,9 @@ from pyflutterflow.utils import trigger_slack_webhook
 
 logger = get_logger(__name__)
 
+# FCM accepts at most 500 device tokens in a single multicast message.
+FCM_MULTICAST_LIMIT = 500
+
 
 class PushNotificationService:
 
@@ -68,24 +71,28 @@ class PushNotificationService:
             )
         )
         pending_notification = messaging.Notification(title=notification.title, body=notification.body, image=notification.image_url)
-        multicast_message = messaging.MulticastMessage(
-            notification=pending_notification,
-            tokens=user_tokens,
-            apns=apns,
-            data=notification.deep_link.ff_route if notification.deep_link else None
-        )
+        data = notification.deep_link.ff_route if notification.deep_link else None
 
         if not user_tokens:
             logger.warning("No FCM tokens found while sending notification")
             trigger_slack_webhook("No matching FCM tokens found while sending notification. Aborting push notification send.")
             return
 
-        try:
-            logger.info("Sending batch notification with title '%s'", notification.title)
-            messaging.send_each_for_multicast(multicast_message)
-            logger.info("The notification was sent to %s devices: [%s]", len(user_tokens), user_tokens[:5])
-        except Exception as exp:
-            logger.error("Error while sending notification to devices: %s", exp)
+        # The notification payload is shared; only the token list differs between batches
+        for start in range(0, len(user_tokens), FCM_MULTICAST_LIMIT):
+            batch_tokens = user_tokens[start:start + FCM_MULTICAST_LIMIT]
+            multicast_message = messaging.MulticastMessage(
+                notification=pending_notification,
+                tokens=batch_tokens,
+                apns=apns,
+                data=data
+            )
+            try:
+                logger.info("Sending batch notification with title '%s'", notification.title)
+                messaging.send_each_for_multicast(multicast_message)
+                logger.info("The notification was sent to %s devices: [%s]", len(batch_tokens), batch_tokens[:5])
+            except Exception as exp:
+                logger.error("Error while sending notification to devices: %s", exp)
 
     def add_user_to_topic(self, user_id, topic):
         """
@@ -1,13 +1,16 @@
 import json
-from pydantic import BaseModel
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict
 
 
 class DeepLink(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ff_page: str
     deep_link_parameter_name: str | None = None
     destination_id: str | int | None = None
 
-    @property
+    @cached_property
     def ff_route(self) -> dict | None:
         if self.ff_page and self.deep_link_parameter_name and self.destination_id:
             return {
@@ -32,6 +35,8 @@ class UserNotificationsRequest(BaseModel):
 
 
 class Notification(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     body: str
     image_url: str | None = None
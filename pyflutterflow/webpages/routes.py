@@ -1,43 +1,79 @@
 import importlib.resources as resources
-from fastapi import APIRouter, Request, status
+from cachetools import TTLCache
+from jinja2 import Environment, FileSystemLoader
+from fastapi import APIRouter, BackgroundTasks, Request, status
 from fastapi.templating import Jinja2Templates
 from pyflutterflow.logs import get_logger
 from pyflutterflow.database.supabase.supabase_functions import get_request
 from pyflutterflow.constants import TERMS_AND_CONDITIONS_ROW_ID, PRIVACY_POLICY_ROW_ID, COMPLIANCE_TABLE
 from pyflutterflow.services.email.resend_service import ResendService
+from pyflutterflow.utils import trigger_slack_webhook
 from pyflutterflow import PyFlutterflow
 
 templates_dir = resources.files("pyflutterflow") / "webpages/templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+# The templates ship with the package and never change at runtime, so they are compiled
+# once at import and Jinja's per-render modification check is switched off.
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(str(templates_dir)),
+    autoescape=True,
+    auto_reload=False,
+))
+
+
+def compile_templates() -> None:
+    """Compile every packaged template up front, so the first request to a page doesn't pay for it."""
+    for template_name in templates.env.list_templates():
+        templates.get_template(template_name)
+
+
+compile_templates()
 
 logger = get_logger(__name__)
 
+# Compliance pages change rarely, so they are cached in-process and by browsers/CDNs.
+COMPLIANCE_CACHE_SECONDS = 3600
+compliance_cache = TTLCache(maxsize=8, ttl=COMPLIANCE_CACHE_SECONDS)
+COMPLIANCE_CACHE_HEADERS = {"Cache-Control": f"public, max-age={COMPLIANCE_CACHE_SECONDS}, stale-while-revalidate=600"}
+
 webpages_router = APIRouter(
     prefix='/webpages',
 )
 
+
+async def get_compliance_rows(row_id: str) -> list[dict]:
+    """Reads a row of the app_compliance table, served from the compliance cache when possible."""
+    data = compliance_cache.get(row_id)
+    if data is None:
+        data = await get_request(COMPLIANCE_TABLE, eq=('id', row_id))
+        if len(data) == 1:
+            compliance_cache[row_id] = data
+    return data
+
+
 @webpages_router.get('/terms-and-conditions', status_code=status.HTTP_200_OK)
 async def get_terms_and_conditions(request: Request):
     """Reads the app_compliance table in Supabase, and returns the terms and conditions HTML"""
-    data = await get_request(COMPLIANCE_TABLE, eq=('id', TERMS_AND_CONDITIONS_ROW_ID))
+    data = await get_compliance_rows(TERMS_AND_CONDITIONS_ROW_ID)
     if len(data) != 1:
         raise ValueError("Terms and conditions not found or wrong number of rows returned")
     return templates.TemplateResponse(
         request=request,
         name="layout.html",
         context={"html_content": data[0].get('html')},
+        headers=COMPLIANCE_CACHE_HEADERS,
     )
 
 @webpages_router.get('/privacy-policy', status_code=status.HTTP_200_OK)
 async def get_privacy_policy(request: Request):
     """Reads the app_compliance table in Supabase, and returns the privacy policy HTML"""
-    data = await get_request(COMPLIANCE_TABLE, eq=('id', PRIVACY_POLICY_ROW_ID))
+    data = await get_compliance_rows(PRIVACY_POLICY_ROW_ID)
     if len(data) != 1:
         raise ValueError("Privacy policy not found or wrong number of rows returned")
     return templates.TemplateResponse(
         request=request,
         name="layout.html",
         context={"html_content": data[0].get('html')},
+        headers=COMPLIANCE_CACHE_HEADERS,
     )
 
 
@@ -52,30 +88,34 @@ async def get_data_deletion_request_form(request: Request):
     )
 
 
+async def send_data_deletion_email(email: str | None, html: str) -> None:
+    """
+    Background task for a data deletion request. The user has already been told the request
+    was submitted, so a failure is logged and sent to Slack instead of being lost.
+    """
+    try:
+        await ResendService().send_email_to_admins(subject='Data deletion request', html=html)
+    except Exception as e:
+        logger.error("Unable to email the data deletion request from %s to the admins: %s", email, e)
+        trigger_slack_webhook(f"A data deletion request from {email} could not be emailed to the admins: {e}")
+
+
 @webpages_router.post('/data-removal-request', status_code=status.HTTP_200_OK)
-async def get_data_deletion_request_submit(request: Request):
+async def get_data_deletion_request_submit(request: Request, background_tasks: BackgroundTasks):
+    """
+    Emails the data deletion request to the admins. The email is sent in the background
+    after the confirmation page is returned, so the user does not wait on Resend.
+    """
 
     # TODO this will send an email if resend is set up, but we still need to add a database entry.
 
     form_data = await request.form()
-    html = f"""
-        <p>Dear Admin,</p>
-        <p>A user has requested to delete their data. Please take the necessary steps to delete their data.</p>
-        <p>Details:</p>
-        <p>Name: {form_data.get('name')}</p>
-        <p>Email: {form_data.get('email')}</p>
-        <br>
-        <p>Message:</p>
-        <p>{form_data.get('message')}</p>
-        <br>
-
-        <p>This is an automated email.</p>
-    """
-    resend_service = ResendService()
-    await resend_service.send_email_to_admins(
-        subject='Data deletion request',
-        html=html
+    html = templates.get_template("admin_data_deletion_email.html").render(
+        name=form_data.get('name'),
+        email=form_data.get('email'),
+        message=form_data.get('message'),
     )
+    background_tasks.add_task(send_data_deletion_email, email=form_data.get('email'), html=html)
     return templates.TemplateResponse(
         request=request, name="data_deletion_request_submitted.html"
     )
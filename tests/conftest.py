@@ -64,6 +64,13 @@ async def async_client(reset_db):
         yield async_client
 
 
+@pytest_asyncio.fixture(loop_scope="function")
+async def app_client():
+    """A client for tests that do not need Supabase, so the database is not reset."""
+    async with AsyncClient(app=app, base_url="http://localhost:8000") as app_client:
+        yield app_client
+
+
 async def createuser(user):
     supabase_client = await SupabaseClient().get_client()
     try:
@@ -0,0 +1,275 @@
+import time
+import hashlib
+from types import SimpleNamespace
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from pyflutterflow import auth as pyff_auth
+from tests.fixtures.sample_users import admin
+
+TOKEN = "a-firebase-id-token"
+
+
+def decoded_token(**overrides):
+    now = int(time.time())
+    token = {
+        "uid": "iamquill",
+        "email": "quill@email.com",
+        "email_verified": True,
+        "auth_time": now,
+        "iat": now,
+        "exp": now + 3600,
+    }
+    token.update(overrides)
+    return token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    pyff_auth._token_cache.clear()
+    yield
+    pyff_auth._token_cache.clear()
+
+
+@pytest.fixture
+def fake_verify(monkeypatch):
+    """Replace firebase token verification. Each call is recorded in calls, and tests set token to control the result."""
+    fake = SimpleNamespace(calls=[], token=decoded_token())
+
+    def fake_verify_id_token(credentials):
+        fake.calls.append(credentials)
+        return dict(fake.token)
+
+    monkeypatch.setattr(pyff_auth.auth, "verify_id_token", fake_verify_id_token)
+    return fake
+
+
+def credentials(token: str = TOKEN) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+async def test_repeat_token_is_verified_once(fake_verify):
+    first = await pyff_auth.get_current_user(credentials())
+    second = await pyff_auth.get_current_user(credentials())
+    assert len(fake_verify.calls) == 1
+    assert first.uid == second.uid == "iamquill"
+
+
+async def test_expired_cache_entry_is_verified_again(fake_verify):
+    fake_verify.token = decoded_token(exp=int(time.time()) - 1)
+    await pyff_auth.get_current_user(credentials())
+    await pyff_auth.get_current_user(credentials())
+    assert len(fake_verify.calls) == 2
+
+
+async def test_unverified_email_is_not_cached(fake_verify, monkeypatch):
+    class StrictSettings:
+        require_verified_email = True
+
+    monkeypatch.setattr(pyff_auth, "get_settings", lambda: StrictSettings())
+    fake_verify.token = decoded_token(email_verified=False)
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            await pyff_auth.get_current_user(credentials())
+        assert exc_info.value.status_code == 401
+    assert len(fake_verify.calls) == 2
+    assert len(pyff_auth._token_cache) == 0
+
+
+async def test_cache_is_keyed_by_token_hash(fake_verify):
+    await pyff_auth.get_current_user(credentials())
+    assert list(pyff_auth._token_cache.keys()) == [hashlib.sha256(TOKEN.encode()).hexdigest()]
+    assert TOKEN not in pyff_auth._token_cache
+
+
+class FakeUserRecord:
+    def __init__(self, uid):
+        self._data = {"localId": uid, "email": f"{uid}@email.com", "lastLoginAt": "1", "createdAt": "1"}
+
+
+class FakeUsersPage:
+    def __init__(self, users, next_page_token):
+        self.users = users
+        self.next_page_token = next_page_token
+
+
+async def test_users_list_returns_next_page_token_header(app_client, login_as_admin, monkeypatch):
+    list_users_calls = []
+
+    def fake_list_users(page_token=None, max_results=1000):
+        list_users_calls.append((page_token, max_results))
+        return FakeUsersPage([FakeUserRecord("iamquill")], next_page_token="page-2")
+
+    monkeypatch.setattr(pyff_auth.auth, "list_users", fake_list_users)
+    response = await app_client.get("/admin/auth/users", params={"page_token": "page-1", "page_size": 1})
+    assert response.status_code == 200
+    assert response.headers[pyff_auth.NEXT_PAGE_TOKEN_HEADER] == "page-2"
+    assert [user["uid"] for user in response.json()] == ["iamquill"]
+    assert list_users_calls == [("page-1", 1)]
+
+
+async def test_users_list_rejects_invalid_page_token(app_client, login_as_admin, monkeypatch):
+    def fake_list_users(page_token=None, max_results=1000):
+        raise ValueError("Page token must be a non-empty string.")
+
+    monkeypatch.setattr(pyff_auth.auth, "list_users", fake_list_users)
+    response = await app_client.get("/admin/auth/users", params={"page_token": "bad"})
+    assert response.status_code == 400
+
+
+async def test_users_list_serializes_users_without_email_or_login(app_client, login_as_admin, monkeypatch):
+    anonymous_user = FakeUserRecord("anonymous")
+    anonymous_user._data = {"localId": "anonymous", "createdAt": "1"}
+    monkeypatch.setattr(pyff_auth.auth, "list_users", lambda page_token=None, max_results=1000: FakeUsersPage([anonymous_user], None))
+    response = await app_client.get("/admin/auth/users")
+    assert response.status_code == 200
+    user = response.json()[0]
+    assert user["email"] == pyff_auth.constants.GUEST_EMAIL
+    assert user["last_login_at"] is None
+
+
+async def test_admin_flag_is_not_written_when_role_claim_fails(monkeypatch):
+    flag_writes = []
+
+    def failing_set_custom_user_claims(uid, claims):
+        raise RuntimeError("firebase unavailable")
+
+    async def fake_set_admin_flag(user_id, is_admin):
+        flag_writes.append((user_id, is_admin))
+
+    monkeypatch.setattr(pyff_auth.auth, "set_custom_user_claims", failing_set_custom_user_claims)
+    monkeypatch.setattr(pyff_auth, "set_admin_flag", fake_set_admin_flag)
+    with pytest.raises(HTTPException) as exc_info:
+        await pyff_auth.set_user_role(pyff_auth.FirebaseUserClaims(uid="iamquill", role="admin"), admin)
+    assert exc_info.value.status_code == 500
+    assert flag_writes == []
+
+
+class FakeSupabaseResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeSupabaseQuery:
+    def __init__(self, supabase, table):
+        self.supabase = supabase
+        self.table = table
+        self.rows = None
+        self.bounds = None
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def insert(self, rows):
+        self.rows = rows
+        return self
+
+    async def execute(self):
+        if self.rows is None:
+            self.supabase.range_calls.append(self.bounds)
+            start, end = self.bounds
+            return FakeSupabaseResponse([{"id": user_id} for user_id in self.supabase.user_ids[start:end + 1]])
+        if self.supabase.failures and self.supabase.failures[0](self.rows):
+            self.supabase.failures.pop(0)
+            raise pyff_auth.APIError({"message": "insert failed"})
+        self.supabase.inserts.append(self.rows)
+        return FakeSupabaseResponse(self.rows)
+
+
+class FakeSupabase:
+    """Records the users-table reads and inserts made by the user sync. Each entry in failures fails one matching insert."""
+
+    def __init__(self, user_ids=(), failures=()):
+        self.user_ids = list(user_ids)
+        self.failures = list(failures)
+        self.range_calls = []
+        self.inserts = []
+
+    def table(self, name):
+        return FakeSupabaseQuery(self, name)
+
+
+class FakeUserDocument:
+    def __init__(self, uid):
+        self.id = uid
+
+    def to_dict(self):
+        return {"display_name": self.id, "email": f"{self.id}@email.com", "photo_url": "photo"}
+
+
+class FakeUsersCollection:
+    def __init__(self, uids):
+        self.uids = uids
+
+    async def stream(self):
+        for uid in self.uids:
+            yield FakeUserDocument(uid)
+
+
+@pytest.fixture
+def user_sync(monkeypatch):
+    """Wire run_supabase_firestore_user_sync to fakes. Returns a function taking the Supabase fake and the firestore uids."""
+    class SyncSettings:
+        users_table = "users"
+        avatar_placeholder_url = ""
+
+    monkeypatch.setattr(pyff_auth, "get_settings", lambda: SyncSettings())
+    monkeypatch.setattr(pyff_auth, "USER_SYNC_ID_PAGE_SIZE", 2)
+    monkeypatch.setattr(pyff_auth, "USER_SYNC_BATCH_SIZE", 2)
+
+    async def run(supabase, firestore_uids):
+        class FakeSupabaseClient:
+            async def get_client(self):
+                return supabase
+
+        class FakeFirestoreClient:
+            def get_client(self):
+                class FakeFirestore:
+                    def collection(self, name):
+                        return FakeUsersCollection(firestore_uids)
+                return FakeFirestore()
+
+        monkeypatch.setattr(pyff_auth, "SupabaseClient", FakeSupabaseClient)
+        monkeypatch.setattr(pyff_auth, "FirestoreClient", FakeFirestoreClient)
+        await pyff_auth.run_supabase_firestore_user_sync(admin)
+
+    return run
+
+
+async def test_supabase_user_ids_are_read_until_a_short_page(monkeypatch):
+    monkeypatch.setattr(pyff_auth, "USER_SYNC_ID_PAGE_SIZE", 2)
+    supabase = FakeSupabase(user_ids=["a", "b", "c"])
+    assert await pyff_auth.get_supabase_user_ids(supabase, "users") == {"a", "b", "c"}
+    assert supabase.range_calls == [(0, 1), (2, 3)]
+
+
+async def test_user_sync_inserts_missing_users_in_batches(user_sync):
+    supabase = FakeSupabase(user_ids=["a"])
+    await user_sync(supabase, ["a", "b", "c", "d", "e", "f"])
+    assert [[row["id"] for row in batch] for batch in supabase.inserts] == [["b", "c"], ["d", "e"], ["f"]]
+
+
+async def test_user_sync_falls_back_to_row_inserts_when_a_batch_fails(user_sync):
+    supabase = FakeSupabase(failures=[lambda rows: isinstance(rows, list)])
+    await user_sync(supabase, ["a", "b", "c"])
+    first_batch, second_batch = supabase.inserts[:2], supabase.inserts[2]
+    assert [row["id"] for row in first_batch] == ["a", "b"]
+    assert all(isinstance(row, dict) for row in first_batch)
+    assert [row["id"] for row in second_batch] == ["c"]
+
+
+async def test_failed_row_inserts_are_logged(monkeypatch):
+    errors = []
+    monkeypatch.setattr(pyff_auth.logger, "error", lambda message, *args: errors.append(args))
+    supabase = FakeSupabase(failures=[lambda row: row["id"] == "b"])
+    rows = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+    await pyff_auth.insert_users_individually(supabase, "users", rows)
+    assert [row["id"] for row in supabase.inserts] == ["a", "c"]
+    assert [args[0] for args in errors] == ["b"]
@@ -0,0 +1,24 @@
+import pytest
+from pyflutterflow.routes import load_admin_config
+
+
+@pytest.fixture
+def admin_config(tmp_path, monkeypatch):
+    """Serve a minimal admin config from a temporary working directory."""
+    (tmp_path / "admin_config.dev.json").write_text('{"tables": []}')
+    monkeypatch.chdir(tmp_path)
+    load_admin_config.cache_clear()
+    yield
+    load_admin_config.cache_clear()
+
+
+async def test_configure_returns_304_for_matching_etag(app_client, admin_config):
+    response = await app_client.get("/configure")
+    assert response.status_code == 200
+    assert response.json() == {"tables": []}
+    etag = response.headers["etag"]
+
+    response = await app_client.get("/configure", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
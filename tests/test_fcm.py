@@ -0,0 +1,18 @@
+from pyflutterflow.services.notifications import fcm
+from pyflutterflow.services.notifications.models import Notification
+
+
+def test_device_tokens_are_sent_in_batches_and_a_failed_batch_does_not_stop_the_rest(monkeypatch):
+    sent_batches = []
+
+    def fake_send_each_for_multicast(message):
+        sent_batches.append(message.tokens)
+        if len(sent_batches) == 1:
+            raise RuntimeError("FCM unavailable")
+
+    monkeypatch.setattr(fcm.firestore, "client", lambda: None)
+    monkeypatch.setattr(fcm.messaging, "send_each_for_multicast", fake_send_each_for_multicast)
+    tokens = [f"token-{i}" for i in range(1001)]
+    fcm.PushNotificationService().send_notification_to_devices(tokens, Notification(title="Hello", body="World"))
+    assert [len(batch) for batch in sent_batches] == [500, 500, 1]
+    assert [token for batch in sent_batches for token in batch] == tokens
@@ -0,0 +1,188 @@
+import pytest
+from pydantic import BaseModel
+from pyflutterflow.database.firestore.FirestoreModel import FirestoreModel
+from pyflutterflow.database.firestore.firestore_client import FirestoreClient
+from pyflutterflow.database.firestore.firestore_repository import FirestoreRepository
+from tests.fixtures.sample_users import quill, rocket, admin
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeDocumentReference:
+    def __init__(self, documents, doc_id):
+        self.documents = documents
+        self.id = doc_id
+
+    async def get(self, field_paths=None, transaction=None):
+        data = self.documents.get(self.id)
+        if data is not None and field_paths is not None:
+            data = {key: value for key, value in data.items() if key in field_paths}
+        return FakeSnapshot(self.id, data)
+
+    async def set(self, data):
+        self.documents[self.id] = dict(data)
+
+    async def update(self, data):
+        self.documents[self.id].update(data)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = {}
+
+    def document(self, doc_id):
+        return FakeDocumentReference(self.documents, doc_id)
+
+
+class FakeTransaction:
+    """Provides what async_transactional needs. Deletes are applied on commit and dropped on rollback."""
+    _id = b"transaction"
+    _read_only = False
+    _max_attempts = 1
+
+    def __init__(self):
+        self.deletes = []
+
+    def _clean_up(self):
+        pass
+
+    async def _begin(self, retry_id=None):
+        pass
+
+    def delete(self, doc_ref):
+        self.deletes.append(doc_ref)
+
+    async def _commit(self):
+        for doc_ref in self.deletes:
+            del doc_ref.documents[doc_ref.id]
+
+    async def _rollback(self):
+        self.deletes.clear()
+
+
+class FakeFirestore:
+    """An in-memory stand-in for the Firestore AsyncClient, covering the calls the repository makes."""
+
+    def __init__(self):
+        self.collections = {}
+        self.get_all_calls = 0
+
+    def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+    def transaction(self):
+        return FakeTransaction()
+
+    async def get_all(self, doc_refs):
+        self.get_all_calls += 1
+        for doc_ref in doc_refs:
+            yield await doc_ref.get()
+
+
+@pytest.fixture
+def firestore(monkeypatch):
+    fake_firestore = FakeFirestore()
+    monkeypatch.setattr(FirestoreClient, "_client", fake_firestore)
+    return fake_firestore
+
+
+class Note(FirestoreModel):
+    id: str
+    user_id: str
+    title: str
+    is_public: bool
+
+    class Settings:
+        name = "notes"
+
+
+class NoteCreate(BaseModel):
+    title: str
+    is_public: bool = False
+
+
+class NoteRepository(FirestoreRepository):
+    # FirestoreRepository leaves restricted_delete abstract; delete already checks ownership.
+    async def restricted_delete(self, pk, current_user):
+        return await self.delete(pk, current_user)
+
+
+async def test_create_keeps_create_schema_defaults(firestore):
+    repository = NoteRepository(Note)
+    note = await repository.create(NoteCreate(title="x"), quill, id="note-1")
+    assert note.is_public is False
+    assert note.user_id == quill.uid
+    stored = firestore.collection("notes").documents["note-1"]
+    assert stored["is_public"] is False
+    assert stored["title"] == "x"
+
+
+def add_note(firestore, note_id, **fields):
+    firestore.collection("notes").documents[note_id] = {"id": note_id, "title": note_id, "is_public": False, **fields}
+
+
+async def test_delete_removes_an_owned_document(firestore):
+    add_note(firestore, "note-1", user_id=quill.uid)
+    await NoteRepository(Note).delete("note-1", quill)
+    assert "note-1" not in firestore.collection("notes").documents
+
+
+async def test_admin_can_delete_any_document(firestore):
+    add_note(firestore, "note-1", user_id=quill.uid)
+    await NoteRepository(Note).delete("note-1", admin)
+    assert "note-1" not in firestore.collection("notes").documents
+
+
+async def test_delete_refuses_a_document_owned_by_another_user(firestore):
+    add_note(firestore, "note-1", user_id=quill.uid)
+    with pytest.raises(ValueError, match="without privileges"):
+        await NoteRepository(Note).delete("note-1", rocket)
+    assert "note-1" in firestore.collection("notes").documents
+
+
+async def test_delete_raises_for_a_missing_document(firestore):
+    with pytest.raises(ValueError, match="Record not found"):
+        await NoteRepository(Note).delete("missing", quill)
+
+
+async def test_delete_raises_for_a_document_without_user_id(firestore):
+    add_note(firestore, "note-1")
+    with pytest.raises(ValueError, match="user_id"):
+        await NoteRepository(Note).delete("note-1", admin)
+    assert "note-1" in firestore.collection("notes").documents
+
+
+async def test_get_many_skips_missing_and_unowned_documents(firestore):
+    add_note(firestore, "mine", user_id=quill.uid)
+    add_note(firestore, "theirs", user_id=rocket.uid)
+    notes = await NoteRepository(Note).get_many(["mine", "theirs", "missing"], quill)
+    assert [note.id for note in notes] == ["mine"]
+
+
+async def test_get_many_returns_every_document_to_an_admin(firestore):
+    add_note(firestore, "mine", user_id=quill.uid)
+    add_note(firestore, "theirs", user_id=rocket.uid)
+    notes = await NoteRepository(Note).get_many(["mine", "theirs"], admin)
+    assert sorted(note.id for note in notes) == ["mine", "theirs"]
+
+
+async def test_get_many_raises_for_a_document_without_user_id(firestore):
+    add_note(firestore, "orphan")
+    with pytest.raises(ValueError, match="user_id"):
+        await NoteRepository(Note).get_many(["orphan"], admin)
+
+
+async def test_get_many_with_no_ids_skips_the_read(firestore):
+    assert await NoteRepository(Note).get_many([], quill) == []
+    assert firestore.get_all_calls == 0
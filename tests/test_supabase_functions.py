@@ -0,0 +1,33 @@
+import httpx
+import jwt
+from pyflutterflow.database.supabase import supabase_functions
+
+
+async def test_proxy_client_is_recreated_after_close():
+    client = supabase_functions.get_proxy_client()
+    assert supabase_functions.get_proxy_client() is client
+    await supabase_functions.close_proxy_client()
+    assert client.is_closed
+    new_client = supabase_functions.get_proxy_client()
+    assert new_client is not client
+    assert not new_client.is_closed
+    await supabase_functions.close_proxy_client()
+
+
+async def test_proxy_client_does_not_keep_response_cookies():
+    client = supabase_functions.get_proxy_client()
+    request = httpx.Request("GET", "http://localhost:8000/rest/v1/items")
+    response = httpx.Response(200, headers={"Set-Cookie": "__cf_bm=abc; Path=/"}, request=request)
+    client.cookies.extract_cookies(response)
+    assert len(client.cookies) == 0
+    await supabase_functions.close_proxy_client()
+
+
+def test_cached_tokens_are_keyed_by_role():
+    supabase_functions.token_cache.clear()
+    admin_token = supabase_functions.get_token("iamadmin", "admin")
+    user_token = supabase_functions.get_token("iamadmin")
+    assert jwt.decode(admin_token, options={"verify_signature": False})["role"] == "admin"
+    assert jwt.decode(user_token, options={"verify_signature": False})["role"] == "authenticated"
+    assert supabase_functions.get_token("iamadmin", "admin") == admin_token
+    supabase_functions.token_cache.clear()
@@ -0,0 +1,17 @@
+from pyflutterflow.webpages import routes as webpages_routes
+
+
+async def test_failed_data_deletion_email_is_reported(monkeypatch):
+    errors, slack_messages = [], []
+
+    async def failing_send_email_to_admins(self, subject, html):
+        raise ValueError("No admins found")
+
+    monkeypatch.setattr(webpages_routes.ResendService, "__init__", lambda self: None)
+    monkeypatch.setattr(webpages_routes.ResendService, "send_email_to_admins", failing_send_email_to_admins)
+    monkeypatch.setattr(webpages_routes.logger, "error", lambda message, *args: errors.append(args))
+    monkeypatch.setattr(webpages_routes, "trigger_slack_webhook", slack_messages.append)
+    await webpages_routes.send_data_deletion_email(email="quill@email.com", html="<p>delete me</p>")
+    assert len(errors) == 1
+    assert len(slack_messages) == 1
+    assert "quill@email.com" in slack_messages[0]